@@ -9,6 +9,7 @@ efficient incremental updates - only fetching new data since the last poll.
 Requirements:
     pip install psutil
     # or: uv add psutil
+    # optional, faster JSON for /api/logs: pip install orjson
 
 Run with:
     uvicorn examples.dashboard_example:app --reload
@@ -23,30 +24,47 @@ Then visit:
 import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
 
-from fastapi import FastAPI
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 
-from examples.dashboard_html import DASHBOARD_HTML
+from examples.dashboard_html import DASHBOARD_ETAG, DASHBOARD_HTML_BYTES
 from examples.dashboard_metrics_collector import collect_system_metrics
 from observabilipy import get_logger
 from observabilipy.adapters.frameworks.fastapi import create_observability_router
-from observabilipy.adapters.storage.in_memory import (
-    InMemoryLogStorage,
-    InMemoryMetricsStorage,
-)
+from observabilipy.adapters.storage.in_memory import InMemoryMetricsStorage
+from observabilipy.adapters.storage.ring_buffer import RingBufferLogStorage
 from observabilipy.core.models import RetentionPolicy
 from observabilipy.runtime.embedded import EmbeddedRuntime
 
-# Storage (in-memory for this example, use SQLite for persistence)
-log_storage = InMemoryLogStorage()
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when available, stdlib json otherwise."""
+
+    def render(self, content: Any) -> bytes:
+        """Serialize content to JSON bytes."""
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Storage (in-memory for this example, use SQLite for persistence). Logs live
+# in a ring buffer so the 1000-entry cap is enforced on write in O(1) rather
+# than by the periodic retention sweep.
+log_storage = RingBufferLogStorage(max_size=1000)
 metrics_storage = InMemoryMetricsStorage()
 
 # Application logger
 logger = get_logger("dashboard")
 
-# Retention: keep 10 minutes of data, max 1000 samples
-log_retention = RetentionPolicy(max_age_seconds=600, max_count=1000)
+# Retention: keep 10 minutes of data (log count is capped by the ring buffer)
+log_retention = RetentionPolicy(max_age_seconds=600)
 metrics_retention = RetentionPolicy(max_age_seconds=600, max_count=5000)
 
 # Runtime handles background cleanup
@@ -59,32 +77,32 @@ runtime = EmbeddedRuntime(
 )
 
 
-async def get_logs_json() -> JSONResponse:
-    """Return logs as JSON for the dashboard."""
-    logs: list[dict] = []
-
-    async for entry in log_storage.read():
-        logs.append(
-            {
-                "timestamp": entry.timestamp,
-                "level": entry.level,
-                "message": entry.message,
-                "attributes": entry.attributes,
-            }
-        )
+# Number of newest log entries returned by /api/logs
+API_LOGS_LIMIT = 100
 
-    # Sort by timestamp descending (newest first)
-    logs.sort(key=lambda x: x["timestamp"], reverse=True)
 
-    # Return last 100 logs
-    return JSONResponse(content=logs[:100])
+async def get_logs_json() -> ORJSONResponse:
+    """Return the newest logs as JSON for the dashboard."""
+    # Newest first, read from the tail of the ring buffer
+    logs = [
+        {
+            "timestamp": entry.timestamp,
+            "level": entry.level,
+            "message": entry.message,
+            "attributes": entry.attributes,
+        }
+        for entry in await log_storage.read_latest(API_LOGS_LIMIT)
+    ]
+    return ORJSONResponse(content=logs)
 
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
     """Manage application startup and shutdown."""
     # Start metrics collection
-    metrics_task = asyncio.create_task(collect_system_metrics(metrics_storage))
+    metrics_task = asyncio.create_task(
+        collect_system_metrics(metrics_storage, log_storage)
+    )
     # Start cleanup task
     cleanup_task = asyncio.create_task(runtime.cleanup_loop())
 
@@ -110,13 +128,20 @@ app = FastAPI(title="System Metrics Dashboard", lifespan=lifespan)
 app.include_router(create_observability_router(log_storage, metrics_storage))
 
 
-@app.get("/api/logs", response_class=JSONResponse)
-async def api_logs() -> JSONResponse:
+@app.get("/api/logs", response_class=ORJSONResponse)
+async def api_logs() -> ORJSONResponse:
     """API endpoint for dashboard log fetching."""
     return await get_logs_json()
 
 
+# Browsers may reuse the page for 5 minutes, then revalidate with the ETag
+_DASHBOARD_HEADERS = {"Cache-Control": "public, max-age=300", "ETag": DASHBOARD_ETAG}
+
+
 @app.get("/", response_class=HTMLResponse)
-async def dashboard() -> HTMLResponse:
-    """Serve the dashboard HTML."""
-    return HTMLResponse(content=DASHBOARD_HTML)
+async def dashboard(request: Request) -> Response:
+    """Serve the pre-encoded dashboard HTML, or 304 if the client has it."""
+    tags = {tag.strip() for tag in request.headers.get("if-none-match", "").split(",")}
+    if "*" in tags or DASHBOARD_ETAG in tags:
+        return Response(status_code=304, headers=_DASHBOARD_HEADERS)
+    return HTMLResponse(content=DASHBOARD_HTML_BYTES, headers=_DASHBOARD_HEADERS)
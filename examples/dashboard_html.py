@@ -3,6 +3,8 @@
 Contains the Chart.js-based dashboard for system metrics display.
 """
 
+import hashlib
+
 DASHBOARD_HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -510,3 +512,7 @@ DASHBOARD_HTML = """<!DOCTYPE html>
 </body>
 </html>
 """
+
+# The page is static, so it is encoded and fingerprinted once at import
+DASHBOARD_HTML_BYTES = DASHBOARD_HTML.encode("utf-8")
+DASHBOARD_ETAG = f'"{hashlib.sha256(DASHBOARD_HTML_BYTES).hexdigest()[:16]}"'
@@ -6,13 +6,16 @@ disk, and network metrics into a metrics storage adapter.
 
 import asyncio
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Protocol
 
 from observabilipy import get_logger
-from observabilipy.core.models import MetricSample
+from observabilipy.core.models import LogEntry, MetricSample
+from observabilipy.core.ports import MetricsStoragePort
 
 if TYPE_CHECKING:
-    from observabilipy.core.ports import MetricsStoragePort
+    from collections.abc import Awaitable, Callable, Iterable
+
+    from observabilipy.core.ports import LogStoragePort
 
 logger = get_logger("dashboard_metrics")
 
@@ -21,10 +24,72 @@ try:
 except ImportError:
     psutil = None  # type: ignore[assignment]
 
+# Shared by every label-free sample instead of a fresh {} per sample. Nothing
+# downstream mutates labels; a MappingProxyType would be safer but is not JSON
+# serialisable, which the NDJSON encoder and SQLite storage both rely on.
+_NO_LABELS: dict[str, str] = {}
+
+
+class BatchMetricsStorage(MetricsStoragePort, Protocol):
+    """A metrics storage that also accepts a whole batch in one call.
+
+    All of the bundled metrics storage adapters provide write_many().
+    """
+
+    async def write_many(self, samples: "Iterable[MetricSample]") -> None: ...
+
+
+# Metric names for the label-free gauges, in the order their values are read
+_MEMORY_METRICS = (
+    "system_memory_percent",
+    "system_memory_used_bytes",
+    "system_memory_available_bytes",
+    "system_memory_total_bytes",
+)
+_DISK_METRICS = ("system_disk_read_bytes_total", "system_disk_write_bytes_total")
+_NETWORK_METRICS = (
+    "system_network_bytes_sent_total",
+    "system_network_bytes_recv_total",
+)
+
+# Seconds between samples
+_INTERVAL_SECONDS = 1.0
+
+
+async def _sleep_until(
+    loop: asyncio.AbstractEventLoop,
+    deadline: float,
+    log: "Callable[[LogEntry], Awaitable[None]]",
+) -> float:
+    """Sleep until the loop-clock deadline and return the deadline reached.
+
+    If the deadline has already passed, logs the lag and returns the current
+    time so the schedule resyncs rather than running catch-up ticks.
+    """
+    delay = deadline - loop.time()
+    if delay > 0:
+        await asyncio.sleep(delay)
+        return deadline
+    await log(
+        logger.with_fields(lag_seconds=round(-delay, 3)).warn(
+            "Metrics collection is lagging behind its interval"
+        )
+    )
+    await asyncio.sleep(0)
+    return loop.time()
+
 
-async def collect_system_metrics(metrics_storage: "MetricsStoragePort") -> None:
+async def collect_system_metrics(
+    metrics_storage: BatchMetricsStorage,
+    log_storage: "LogStoragePort | None" = None,
+) -> None:
     """Collect system CPU and memory metrics every second.
 
+    Ticks are scheduled against absolute monotonic deadlines, so the time
+    spent probing and writing does not stretch the interval. A tick that
+    overruns its slot is logged and the schedule resyncs to now instead of
+    firing a burst of catch-up samples.
+
     Collects:
     - CPU percent (system-wide and per-core)
     - Memory usage (percent, used, available, total bytes)
@@ -34,131 +99,100 @@ async def collect_system_metrics(metrics_storage: "MetricsStoragePort") -> None:
 
     Args:
         metrics_storage: Storage adapter to write metrics to
+        log_storage: Storage adapter for collector warnings (optional)
     """
     if psutil is None:
         print("Warning: psutil not installed - cannot collect system metrics")
         return
 
-    while True:
-        now = time.time()
+    # Hoist attribute lookups out of the loop - this runs every second forever
+    cpu_percent_fn = psutil.cpu_percent
+    virtual_memory = psutil.virtual_memory
+    swap_memory = psutil.swap_memory
+    disk_io_counters = psutil.disk_io_counters
+    net_io_counters = psutil.net_io_counters
+    to_thread = asyncio.to_thread
 
-        # CPU metrics
-        cpu_percent = psutil.cpu_percent(interval=None)
-        per_cpu = psutil.cpu_percent(interval=None, percpu=True)
+    async def log(entry: LogEntry) -> None:
+        if log_storage is not None:
+            await log_storage.write(entry)
 
-        await metrics_storage.write(
-            MetricSample(
-                name="system_cpu_percent",
-                timestamp=now,
-                value=cpu_percent,
-                labels={},
-            )
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
+
+    while True:
+        now = time.time()
+        # The probes read /proc synchronously; running them in worker threads
+        # keeps the event loop free to serve dashboard requests meanwhile
+        per_cpu, mem, swap, disk_io, net_io = await asyncio.gather(
+            to_thread(cpu_percent_fn, interval=None, percpu=True),
+            to_thread(virtual_memory),
+            to_thread(swap_memory),
+            to_thread(disk_io_counters),
+            to_thread(net_io_counters),
+            return_exceptions=True,
         )
+        # Only disk and network failures are tolerated, as before
+        for result in (per_cpu, mem, swap):
+            if isinstance(result, BaseException):
+                raise result
 
-        # Per-CPU metrics
-        for i, cpu_pct in enumerate(per_cpu):
-            await metrics_storage.write(
-                MetricSample(
-                    name="system_cpu_percent_per_core",
-                    timestamp=now,
-                    value=cpu_pct,
-                    labels={"core": str(i)},
-                )
-            )
+        # Label-free gauges are gathered as parallel name/value columns and
+        # turned into samples in one pass at the end of the tick
+        names: list[str] = []
+        values: list[float] = []
+
+        # CPU metrics - the system-wide value is derived from the per-core
+        # readings so /proc/stat is only parsed once per tick
+        names.append("system_cpu_percent")
+        values.append(sum(per_cpu) / len(per_cpu) if per_cpu else 0.0)
 
         # Memory metrics
-        mem = psutil.virtual_memory()
-        await metrics_storage.write(
-            MetricSample(
-                name="system_memory_percent",
-                timestamp=now,
-                value=mem.percent,
-                labels={},
-            )
-        )
-        await metrics_storage.write(
-            MetricSample(
-                name="system_memory_used_bytes",
-                timestamp=now,
-                value=float(mem.used),
-                labels={},
-            )
-        )
-        await metrics_storage.write(
-            MetricSample(
-                name="system_memory_available_bytes",
-                timestamp=now,
-                value=float(mem.available),
-                labels={},
-            )
-        )
-        await metrics_storage.write(
-            MetricSample(
-                name="system_memory_total_bytes",
-                timestamp=now,
-                value=float(mem.total),
-                labels={},
-            )
-        )
+        names += _MEMORY_METRICS
+        values += (mem.percent, float(mem.used), float(mem.available), float(mem.total))
 
         # Swap metrics
-        swap = psutil.swap_memory()
-        await metrics_storage.write(
-            MetricSample(
-                name="system_swap_percent",
-                timestamp=now,
-                value=swap.percent,
-                labels={},
-            )
-        )
+        names.append("system_swap_percent")
+        values.append(swap.percent)
 
         # Disk I/O (if available)
-        try:
-            disk_io = psutil.disk_io_counters()
-            if disk_io:
-                await metrics_storage.write(
-                    MetricSample(
-                        name="system_disk_read_bytes_total",
-                        timestamp=now,
-                        value=float(disk_io.read_bytes),
-                        labels={},
-                    )
-                )
-                await metrics_storage.write(
-                    MetricSample(
-                        name="system_disk_write_bytes_total",
-                        timestamp=now,
-                        value=float(disk_io.write_bytes),
-                        labels={},
-                    )
+        if isinstance(disk_io, Exception):
+            await log(
+                logger.with_fields(error=str(disk_io)).error(
+                    "Failed to collect disk metrics"
                 )
-        except Exception as e:
-            await logger.with_fields(error=str(e)).error(
-                "Failed to collect disk metrics"
             )
+        elif disk_io:
+            names += _DISK_METRICS
+            values += (float(disk_io.read_bytes), float(disk_io.write_bytes))
 
         # Network I/O
-        try:
-            net_io = psutil.net_io_counters()
-            await metrics_storage.write(
-                MetricSample(
-                    name="system_network_bytes_sent_total",
-                    timestamp=now,
-                    value=float(net_io.bytes_sent),
-                    labels={},
+        if isinstance(net_io, Exception):
+            await log(
+                logger.with_fields(error=type(net_io).__name__).error(
+                    "Failed to collect network metrics"
                 )
             )
-            await metrics_storage.write(
-                MetricSample(
-                    name="system_network_bytes_recv_total",
-                    timestamp=now,
-                    value=float(net_io.bytes_recv),
-                    labels={},
-                )
-            )
-        except Exception as e:
-            await logger.with_fields(error=type(e).__name__).error(
-                "Failed to collect network metrics"
+        else:
+            names += _NETWORK_METRICS
+            values += (float(net_io.bytes_sent), float(net_io.bytes_recv))
+
+        batch = [
+            MetricSample(name=name, timestamp=now, value=value, labels=_NO_LABELS)
+            for name, value in zip(names, values, strict=True)
+        ]
+        # Per-CPU metrics
+        batch.extend(
+            MetricSample(
+                name="system_cpu_percent_per_core",
+                timestamp=now,
+                value=cpu_pct,
+                labels={"core": str(i)},
             )
+            for i, cpu_pct in enumerate(per_cpu)
+        )
+
+        # One storage call per tick instead of one per sample
+        await metrics_storage.write_many(batch)
 
-        await asyncio.sleep(1)
+        next_tick = await _sleep_until(loop, next_tick + _INTERVAL_SECONDS, log)
@@ -5,24 +5,23 @@ with any ASGI server (uvicorn, hypercorn, daphne) without requiring FastAPI
 or Django as dependencies.
 """
 
+import asyncio
 import fnmatch
-import json
+import os
+import re
 import time
-import uuid
-from collections.abc import Callable, Coroutine
+from collections.abc import AsyncIterable, Callable, Coroutine, Iterable
 from typing import Any
-from urllib.parse import parse_qs
 
-from observabilipy.adapters.frameworks.query_params import (
-    _parse_level_param,
-    _parse_since_param,
-)
+from observabilipy.adapters.frameworks.query_params import _parse_params
 from observabilipy.adapters.logging_context import clear_log_context, set_log_context
-from observabilipy.core.encoding.ndjson import encode_logs, encode_ndjson
+from observabilipy.core.encoding.ndjson import encode_logs_iter, encode_ndjson_iter
 from observabilipy.core.encoding.prometheus import encode_current
+from observabilipy.core.exceptions import ConfigurationError
 from observabilipy.core.logs import log_exception
 from observabilipy.core.models import LogEntry, MetricSample
 from observabilipy.core.ports import LogStoragePort, MetricsStoragePort
+from observabilipy.core.services import _write_all
 
 # ASGI type aliases
 # @tra: Adapter.ASGI.Fixtures.BasicApp
@@ -32,45 +31,73 @@ Scope = dict[str, Any]
 Receive = Callable[[], Coroutine[Any, Any, dict[str, Any]]]
 Send = Callable[[dict[str, Any]], Coroutine[Any, Any, None]]
 ASGIApp = Callable[[Scope, Receive, Send], Coroutine[Any, Any, None]]
+_RouteHandler = Callable[[Scope, Send], Coroutine[Any, Any, None]]
 
+_Headers = tuple[tuple[bytes, bytes], ...]
 
-def _parse_query_params(scope: Scope) -> dict[str, list[str]]:
-    """Parse query string from ASGI scope into parameter dictionary.
+# Characters that make an exclude_paths entry a glob rather than a literal path
+_GLOB_CHARS = re.compile(r"[*?\[]")
 
-    Args:
-        scope: ASGI scope dictionary containing request metadata.
+# Streamed bodies are flushed to the server once this many bytes are buffered
+_STREAM_CHUNK_SIZE = 64 * 1024
 
-    Returns:
-        Dictionary mapping parameter names to lists of values.
-        Returns empty dict if query_string is missing or empty.
-    """
-    # @tra: Adapter.ASGI.QueryParameter.Parser
-    query_string = scope.get("query_string", b"").decode(errors="replace")
-    return parse_qs(query_string)
+# Header pairs and fixed bodies are encoded once at import. They are kept in
+# immutable tuples and copied into a fresh list per message, because ASGI
+# middleware (e.g. Starlette's MutableHeaders) edits message headers in place.
+_NDJSON_HEADERS: _Headers = ((b"content-type", b"application/x-ndjson"),)
+_PROMETHEUS_HEADERS: _Headers = (
+    (b"content-type", b"text/plain; version=0.0.4; charset=utf-8"),
+)
+_TEXT_HEADERS: _Headers = ((b"content-type", b"text/plain"),)
+_JSON_HEADERS: _Headers = ((b"content-type", b"application/json"),)
+_METHOD_NOT_ALLOWED_HEADERS: _Headers = (*_TEXT_HEADERS, (b"allow", b"GET, HEAD"))
+_NOT_FOUND_BODY = b"Not Found"
+_METHOD_NOT_ALLOWED_BODY = b"Method Not Allowed"
+_ERROR_BODY = b'{"error": "Internal Server Error"}'
 
 
-def _extract_request_id(scope: Scope, header_name: str = "X-Request-ID") -> str:
+def _extract_request_id(scope: Scope, header_bytes: bytes = b"x-request-id") -> str:
     """Extract or generate a request ID from ASGI scope headers.
 
-    Searches for the specified header (case-insensitive). If not found,
-    generates a new UUID.
+    Searches for the specified header. If not found, generates a new UUID.
+    The ASGI spec guarantees lowercased header names in the scope, so names
+    are compared as-is against the pre-lowercased header_bytes.
 
     Args:
         scope: ASGI scope dictionary containing request metadata.
-        header_name: Name of the header to search for (default: "X-Request-ID").
+        header_bytes: Lowercase, encoded name of the header to search for
+            (default: b"x-request-id").
 
     Returns:
         Request ID string (either from header or newly generated UUID).
     """
     # @tra: Adapter.ASGI.Middleware.RequestId.Extract
-    header_bytes = header_name.lower().encode()
     headers: list[tuple[bytes, bytes]] = scope.get("headers", [])
     for name, value in headers:
-        if name.lower() == header_bytes:
+        if name == header_bytes:
             return str(value.decode("utf-8", errors="replace"))
 
     # @tra: Adapter.ASGI.Middleware.RequestId.Generate
-    return str(uuid.uuid4())
+    return _new_request_id()
+
+
+def _new_request_id() -> str:
+    """Generate a random version 4 UUID string.
+
+    Formats ``os.urandom`` output directly instead of building a
+    ``uuid.UUID`` object, keeping the dashed UUID4 form clients expect.
+
+    Returns:
+        Lowercase, dashed UUID4 string.
+
+    Example:
+        >>> import uuid
+        >>> uuid.UUID(_new_request_id()).version
+        4
+    """
+    h = os.urandom(16).hex()
+    variant = "89ab"[int(h[16], 16) & 3]
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{variant}{h[17:20]}-{h[20:]}"
 
 
 def _get_log_level_for_status(status_code: int) -> str:
@@ -98,43 +125,153 @@ def _get_log_level_for_status(status_code: int) -> str:
     return "INFO"
 
 
-async def _send_response(send: Send, status: int, content_type: str, body: str) -> None:
-    """Send an HTTP response with headers and body.
+async def _send_response(
+    send: Send, status: int, headers: _Headers, body: bytes
+) -> None:
+    """Send a fully buffered HTTP response as one body frame.
+
+    Content-Length is appended to the headers, so the server can skip
+    chunked transfer encoding and write the response in one go.
 
     Args:
         send: ASGI send callable for writing response.
         status: HTTP status code.
-        content_type: Content-Type header value.
-        body: Response body as string (will be encoded to bytes).
+        headers: Pre-encoded response headers (e.g. _TEXT_HEADERS).
+        body: Encoded response body.
     """
     # @tra: Adapter.ASGI.SendResponse.Headers
-    headers = [(b"content-type", content_type.encode())]
-    await send({"type": "http.response.start", "status": status, "headers": headers})
+    start_headers = [*headers, (b"content-length", str(len(body)).encode())]
+    await send(
+        {"type": "http.response.start", "status": status, "headers": start_headers}
+    )
     # @tra: Adapter.ASGI.SendResponse.Body
-    await send({"type": "http.response.body", "body": body.encode()})
+    await send({"type": "http.response.body", "body": body})
 
 
-async def _handle_endpoint(
+class _StaticResponse:
+    """A fixed response whose headers, Content-Length included, are built once.
+
+    Used for the 404, 405, and 500 responses so sending them does no header
+    or length work per request. Each send still gets a fresh header list, as
+    outer middleware may edit it in place.
+    """
+
+    __slots__ = ("body", "headers", "status")
+
+    def __init__(self, status: int, headers: _Headers, body: bytes) -> None:
+        self.status = status
+        self.headers: _Headers = (
+            *headers,
+            (b"content-length", str(len(body)).encode()),
+        )
+        self.body = body
+
+    async def send(self, send: Send) -> None:
+        """Send the response start and body frames back to back."""
+        # @tra: Adapter.ASGI.SendResponse.Static
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status,
+                "headers": list(self.headers),
+            }
+        )
+        await send({"type": "http.response.body", "body": self.body})
+
+
+_NOT_FOUND = _StaticResponse(404, _TEXT_HEADERS, _NOT_FOUND_BODY)
+_METHOD_NOT_ALLOWED = _StaticResponse(
+    405, _METHOD_NOT_ALLOWED_HEADERS, _METHOD_NOT_ALLOWED_BODY
+)
+_SERVER_ERROR = _StaticResponse(500, _JSON_HEADERS, _ERROR_BODY)
+
+
+async def _handle_stream_endpoint(
     send: Send,
-    endpoint_func: Callable[[], Coroutine[Any, Any, str]],
-    content_type: str,
+    chunks: AsyncIterable[bytes],
+    headers: _Headers,
     log_message: str,
 ) -> None:
-    """Execute an endpoint function with error handling and send response.
+    """Stream an endpoint body in chunks with error handling.
+
+    Encoded lines are buffered up to _STREAM_CHUNK_SIZE and sent with
+    ``more_body=True``, so peak memory is bounded by the chunk size rather
+    than the full response. Small bodies are sent as a single frame with a
+    Content-Length header; larger ones fall back to chunked transfer.
+
+    If encoding fails before anything has been sent, a 500 JSON error is
+    returned. Once the 200 status is on the wire the exception is re-raised
+    so the server aborts the response instead of sending a truncated body.
+    Errors raised by ``send`` itself are never turned into a 500.
 
     Args:
         send: ASGI send callable for writing response.
-        endpoint_func: Async function that returns response body.
-        content_type: Content-Type header for success response.
+        chunks: Async iterable of encoded body chunks.
+        headers: Pre-encoded headers for the success response.
         log_message: Message to log on error.
     """
-    try:
-        body = await endpoint_func()
-        await _send_response(send, 200, content_type, body)
-    except Exception:
-        log_exception(log_message)
-        error_body = json.dumps({"error": "Internal Server Error"})
-        await _send_response(send, 500, "application/json", error_body)
+    buffer = bytearray()
+    started = False
+    iterator = aiter(chunks)
+    while True:
+        # Only encoding/storage errors get the 500 treatment; a failing
+        # send() (e.g. the client went away) propagates as-is
+        try:
+            chunk = await anext(iterator)
+        except StopAsyncIteration:
+            break
+        except Exception:
+            log_exception(log_message)
+            if started:
+                raise
+            await _SERVER_ERROR.send(send)
+            return
+        buffer += chunk
+        if len(buffer) < _STREAM_CHUNK_SIZE:
+            continue
+        if not started:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": list(headers),
+                }
+            )
+            started = True
+        await send(
+            {"type": "http.response.body", "body": bytes(buffer), "more_body": True}
+        )
+        buffer.clear()
+
+    if not started:
+        # The whole body fit in the buffer, so its length is known
+        await _send_response(send, 200, headers, bytes(buffer))
+        return
+    await send({"type": "http.response.body", "body": bytes(buffer)})
+
+
+class _ResponseCapture:
+    """ASGI send wrapper recording the response status and body size.
+
+    One slotted object per request replaces a send closure plus a state dict.
+    """
+
+    __slots__ = ("body_size", "exception", "send", "status")
+
+    def __init__(self, send: Send) -> None:
+        self.send = send
+        self.status: int | None = None
+        self.body_size = 0
+        self.exception: Exception | None = None
+
+    async def __call__(self, message: dict[str, Any]) -> None:
+        # Body frames outnumber the single start frame, so test them first
+        message_type = message["type"]
+        if message_type == "http.response.body":
+            self.body_size += len(message.get("body", b""))
+        elif message_type == "http.response.start":
+            self.status = message["status"]
+        await self.send(message)
 
 
 # @tra: Adapter.ASGI.Middleware.Init
@@ -172,6 +309,7 @@ class ASGIObservabilityMiddleware:
         self.metrics_storage = metrics_storage
         self.exclude_paths = exclude_paths or []
         self.request_id_header = request_id_header
+        self._request_id_header_bytes = request_id_header.lower().encode("latin-1")
         self.log_requests = True
         self.record_metrics = True
         self.request_counter_name = "http_requests_total"
@@ -213,22 +351,79 @@ class ASGIObservabilityMiddleware:
         """
         self.request_histogram_name = name
 
+    @property
+    def exclude_paths(self) -> tuple[str, ...]:
+        """Paths excluded from logging/metrics (exact or wildcard patterns).
+
+        Returned as a tuple: the matchers are built when this is assigned,
+        so assign a new sequence to change the excluded paths. Releases up to
+        1.4.0 returned the mutable list passed in; see the CHANGELOG.
+        """
+        return self._exclude_paths
+
+    @exclude_paths.setter
+    def exclude_paths(self, patterns: Iterable[str]) -> None:
+        # Split patterns by how cheaply they can be matched: exact paths by set
+        # lookup, "prefix*" patterns by one str.startswith(tuple) call, and
+        # only real globs through a regex compiled here rather than per request
+        self._exclude_paths = tuple(patterns)
+        exact: set[str] = set()
+        prefixes: list[str] = []
+        globs: list[re.Pattern[str]] = []
+        for pattern in self._exclude_paths:
+            if not _GLOB_CHARS.search(pattern):
+                exact.add(pattern)
+            elif pattern.endswith("*") and not _GLOB_CHARS.search(pattern[:-1]):
+                prefixes.append(pattern[:-1])
+            else:
+                globs.append(re.compile(fnmatch.translate(pattern)))
+        self._exclude_exact = frozenset(exact)
+        self._exclude_prefixes = tuple(prefixes)
+        self._exclude_globs = tuple(globs)
+
     def _path_excluded(self, path: str) -> bool:
         """Check if path matches any pattern in exclude_paths."""
-        return any(fnmatch.fnmatch(path, pattern) for pattern in self.exclude_paths)
+        return (
+            path in self._exclude_exact
+            or path.startswith(self._exclude_prefixes)
+            or any(glob.match(path) for glob in self._exclude_globs)
+        )
+
+    def _records_nothing(self, path: str) -> bool:
+        """Check if a request to path would write neither logs nor metrics."""
+        logs_off = not self.log_requests or self.log_storage is None
+        metrics_off = not self.record_metrics or self.metrics_storage is None
+        return (logs_off and metrics_off) or self._path_excluded(path)
 
     async def _write_log_entry(
-        self, scope: Scope, request_data: dict[str, Any]
+        self,
+        scope: Scope,
+        request_id: str,
+        captured: _ResponseCapture,
+        elapsed_ns: int,
     ) -> None:
         """Write request log entry if logging is enabled."""
         if not self.log_requests or self.log_storage is None:
             return
-        log_level = _get_log_level_for_status(request_data["status_code"])
+        # The dict becomes the entry's attributes, so it is only built here,
+        # once logging is known to be enabled
+        status_code = captured.status or 0
+        attributes: dict[str, Any] = {
+            "request_id": request_id,
+            "method": scope["method"],
+            "path": scope["path"],
+            "status_code": status_code,
+            "response_body_size": captured.body_size,
+            "duration_ms": elapsed_ns / 1_000_000,
+        }
+        if captured.exception is not None:
+            exc = captured.exception
+            attributes["exception"] = f"{type(exc).__name__}: {exc!s}"
         log_entry = LogEntry(
             timestamp=time.time(),
-            level=log_level,
+            level=_get_log_level_for_status(status_code),
             message=f"{scope['method']} {scope['path']}",
-            attributes=request_data,
+            attributes=attributes,
         )
         await self.log_storage.write(log_entry)
 
@@ -238,24 +433,22 @@ class ASGIObservabilityMiddleware:
         """Write request metrics if metrics recording is enabled."""
         if not self.record_metrics or self.metrics_storage is None:
             return
+        # Both samples describe the same request: one timestamp, shared labels
+        now = time.time()
+        labels = {"method": scope["method"], "path": scope["path"]}
         counter_metric = MetricSample(
             name=self.request_counter_name,
-            timestamp=time.time(),
+            timestamp=now,
             value=1.0,
-            labels={
-                "method": scope["method"],
-                "path": scope["path"],
-                "status": str(status_code),
-            },
+            labels={**labels, "status": str(status_code)},
         )
-        await self.metrics_storage.write(counter_metric)
         histogram_metric = MetricSample(
             name=self.request_histogram_name,
-            timestamp=time.time(),
+            timestamp=now,
             value=duration,
-            labels={"method": scope["method"], "path": scope["path"]},
+            labels=labels,
         )
-        await self.metrics_storage.write(histogram_metric)
+        await _write_all(self.metrics_storage, (counter_metric, histogram_metric))
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """ASGI callable interface that processes requests through the wrapped app."""
@@ -263,118 +456,187 @@ class ASGIObservabilityMiddleware:
             await self.app(scope, receive, send)
             return
 
-        start_time = time.perf_counter()
-        request_id = _extract_request_id(scope, self.request_id_header)
-        captured: dict[str, Any] = {"status": None, "body_size": 0, "exception": None}
+        request_id = _extract_request_id(scope, self._request_id_header_bytes)
+        if self._records_nothing(scope["path"]):
+            # Nothing to record: keep the request context but skip the send
+            # wrapper and timing, calling the app with the server's send
+            # @tra: Adapter.ASGI.Middleware.Passthrough
+            set_log_context(request_id=request_id)
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                clear_log_context()
+            return
 
-        async def wrapped_send(message: dict[str, Any]) -> None:
-            if message["type"] == "http.response.start":
-                captured["status"] = message["status"]
-            elif message["type"] == "http.response.body":
-                captured["body_size"] += len(message.get("body", b""))
-            await send(message)
+        start_ns = time.perf_counter_ns()
+        captured = _ResponseCapture(send)
 
         set_log_context(request_id=request_id)
         try:
-            await self.app(scope, receive, wrapped_send)
+            await self.app(scope, receive, captured)
         except Exception as e:
-            captured["exception"] = e
-            captured["status"] = 500
+            captured.exception = e
+            captured.status = 500
         finally:
             clear_log_context()
 
-        duration = time.perf_counter() - start_time
-        await self._record_observability(scope, request_id, captured, duration)
-        if captured["exception"] is not None:
-            raise captured["exception"]
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        await self._record_observability(scope, request_id, captured, elapsed_ns)
+        if captured.exception is not None:
+            raise captured.exception
 
     async def _record_observability(
         self,
         scope: Scope,
         request_id: str,
-        captured: dict[str, Any],
-        duration: float,
+        captured: _ResponseCapture,
+        elapsed_ns: int,
     ) -> None:
         """Record logs and metrics for the request."""
-        if self._path_excluded(scope["path"]):
-            return
-        request_data: dict[str, Any] = {
-            "request_id": request_id,
-            "method": scope["method"],
-            "path": scope["path"],
-            "status_code": captured["status"] or 0,
-            "response_body_size": captured["body_size"],
-            "duration_ms": duration * 1000,
-        }
-        if captured["exception"] is not None:
-            exc = captured["exception"]
-            request_data["exception"] = f"{type(exc).__name__}: {exc!s}"
-        await self._write_log_entry(scope, request_data)
-        if captured["status"] is not None:
-            await self._write_metrics(scope, captured["status"], duration)
+        await self._write_log_entry(scope, request_id, captured, elapsed_ns)
+        if captured.status is not None:
+            await self._write_metrics(
+                scope, captured.status, elapsed_ns / 1_000_000_000
+            )
+
+
+class _PrometheusEncoder:
+    """Produces /metrics/prometheus bodies for create_asgi_app.
+
+    Concurrent scrapes join the encode already in flight instead of each
+    repeating the storage read. The shared task is shielded so a client that
+    disconnects does not cancel the encode for the others. With a positive
+    cache_ttl the last body is also reused until it expires. Bodies are
+    kept as bytes so joined and cached responses skip re-encoding.
+    """
+
+    def __init__(self, metrics_storage: MetricsStoragePort, cache_ttl: float) -> None:
+        self._metrics_storage = metrics_storage
+        self._cache_ttl = cache_ttl
+        self._body = b""
+        self._expires = 0.0
+        self._inflight: asyncio.Task[bytes] | None = None
+
+    async def encode(self) -> bytes:
+        """Return the current Prometheus body, cached or freshly encoded."""
+        # @tra: Adapter.ASGI.PrometheusEndpointCache
+        if self._cache_ttl <= 0:
+            return await self._encode_shared()
+        now = time.monotonic()
+        if now >= self._expires:
+            self._body = await self._encode_shared()
+            self._expires = now + self._cache_ttl
+        return self._body
+
+    async def _encode_bytes(self) -> bytes:
+        return (await encode_current(self._metrics_storage.read())).encode()
+
+    async def _encode_shared(self) -> bytes:
+        # @tra: Adapter.ASGI.PrometheusEndpointSingleFlight
+        task = self._inflight
+        if task is None:
+            task = asyncio.create_task(self._encode_bytes())
+            task.add_done_callback(self._clear_inflight)
+            self._inflight = task
+        return await asyncio.shield(task)
+
+    def _clear_inflight(self, task: asyncio.Task[bytes]) -> None:
+        if self._inflight is task:
+            self._inflight = None
 
 
 def create_asgi_app(
     log_storage: LogStoragePort,
     metrics_storage: MetricsStoragePort,
+    prometheus_cache_ttl: float = 0.0,
 ) -> ASGIApp:
     """Create an ASGI app with /metrics, /metrics/prometheus, and /logs endpoints.
 
     Args:
         log_storage: Storage adapter implementing LogStoragePort.
         metrics_storage: Storage adapter implementing MetricsStoragePort.
+        prometheus_cache_ttl: Seconds to reuse the encoded /metrics/prometheus
+            body between scrapes (default: 0, encode on every request).
+            Useful when several scrapers poll the same instance.
 
     Returns:
         ASGI application callable.
+
+    Raises:
+        ConfigurationError: If prometheus_cache_ttl is negative.
     """
+    if prometheus_cache_ttl < 0:
+        raise ConfigurationError(
+            f"prometheus_cache_ttl must be >= 0, got {prometheus_cache_ttl}"
+        )
+    prometheus_encoder = _PrometheusEncoder(metrics_storage, prometheus_cache_ttl)
+
+    # @tra: Adapter.ASGI.MetricsEndpointHTTPStatus
+    # @tra: Adapter.ASGI.MetricsEndpointContentType
+    # @tra: Adapter.ASGI.MetricsEndpointNDJSON
+    # @tra: Adapter.ASGI.MetricsEndpointSinceFilter
+    # @tra: Adapter.ASGI.MetricsEndpointEncodingError
+    async def handle_metrics(scope: Scope, send: Send) -> None:
+        since, _ = _parse_params(scope.get("query_string", b""))
+        await _handle_stream_endpoint(
+            send,
+            encode_ndjson_iter(metrics_storage.read(since=since)),
+            _NDJSON_HEADERS,
+            "Error encoding metrics endpoint",
+        )
+
+    # @tra: Adapter.ASGI.PrometheusEndpointHTTPStatus
+    # @tra: Adapter.ASGI.PrometheusEndpointContentType
+    # @tra: Adapter.ASGI.PrometheusEndpointFormat
+    # @tra: Adapter.ASGI.PrometheusEndpointCurrent
+    async def handle_prometheus(scope: Scope, send: Send) -> None:
+        body = await prometheus_encoder.encode()
+        await _send_response(send, 200, _PROMETHEUS_HEADERS, body)
+
+    # @tra: Adapter.ASGI.LogsEndpointHTTPStatus
+    # @tra: Adapter.ASGI.LogsEndpointContentType
+    # @tra: Adapter.ASGI.LogsEndpointNDJSON
+    # @tra: Adapter.ASGI.LogsEndpointSinceFilter
+    # @tra: Adapter.ASGI.LogsEndpointLevelFilter
+    # @tra: Adapter.ASGI.LogsEndpointEncodingError
+    async def handle_logs(scope: Scope, send: Send) -> None:
+        since, level = _parse_params(scope.get("query_string", b""))
+        await _handle_stream_endpoint(
+            send,
+            encode_logs_iter(log_storage.read(since=since, level=level)),
+            _NDJSON_HEADERS,
+            "Error encoding logs endpoint",
+        )
+
+    # Built once per app so each request is a single hashed lookup. The
+    # headers let HEAD requests answer without reading storage.
+    routes: dict[str, tuple[_RouteHandler, _Headers]] = {
+        "/metrics": (handle_metrics, _NDJSON_HEADERS),
+        "/metrics/prometheus": (handle_prometheus, _PROMETHEUS_HEADERS),
+        "/logs": (handle_logs, _NDJSON_HEADERS),
+    }
 
     async def app(scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] != "http":
             return
 
-        path = scope["path"]
-
-        # @tra: Adapter.ASGI.MetricsEndpointHTTPStatus
-        # @tra: Adapter.ASGI.MetricsEndpointContentType
-        # @tra: Adapter.ASGI.MetricsEndpointNDJSON
-        # @tra: Adapter.ASGI.MetricsEndpointSinceFilter
-        # @tra: Adapter.ASGI.MetricsEndpointEncodingError
-        if path == "/metrics":
-            params = _parse_query_params(scope)
-            since = _parse_since_param(params)
-            await _handle_endpoint(
-                send,
-                lambda: encode_ndjson(metrics_storage.read(since=since)),
-                "application/x-ndjson",
-                "Error encoding metrics endpoint",
-            )
-        # @tra: Adapter.ASGI.PrometheusEndpointHTTPStatus
-        # @tra: Adapter.ASGI.PrometheusEndpointContentType
-        # @tra: Adapter.ASGI.PrometheusEndpointFormat
-        # @tra: Adapter.ASGI.PrometheusEndpointCurrent
-        elif path == "/metrics/prometheus":
-            body = await encode_current(metrics_storage.read())
-            await _send_response(
-                send, 200, "text/plain; version=0.0.4; charset=utf-8", body
-            )
-        # @tra: Adapter.ASGI.LogsEndpointHTTPStatus
-        # @tra: Adapter.ASGI.LogsEndpointContentType
-        # @tra: Adapter.ASGI.LogsEndpointNDJSON
-        # @tra: Adapter.ASGI.LogsEndpointSinceFilter
-        # @tra: Adapter.ASGI.LogsEndpointLevelFilter
-        # @tra: Adapter.ASGI.LogsEndpointEncodingError
-        elif path == "/logs":
-            params = _parse_query_params(scope)
-            since = _parse_since_param(params)
-            level = _parse_level_param(params)
-            await _handle_endpoint(
-                send,
-                lambda: encode_logs(log_storage.read(since=since, level=level)),
-                "application/x-ndjson",
-                "Error encoding logs endpoint",
-            )
+        route = routes.get(scope["path"])
         # @tra: Adapter.ASGI.RoutingUnknownPath
+        if route is None:
+            await _NOT_FOUND.send(send)
+            return
+        handler, headers = route
+        method = scope.get("method", "GET")
+        if method == "GET":
+            await handler(scope, send)
+        elif method == "HEAD":
+            # @tra: Adapter.ASGI.RoutingHead
+            await send(
+                {"type": "http.response.start", "status": 200, "headers": list(headers)}
+            )
+            await send({"type": "http.response.body", "body": b""})
         else:
-            await _send_response(send, 404, "text/plain", "Not Found")
+            # @tra: Adapter.ASGI.RoutingMethodNotAllowed
+            await _METHOD_NOT_ALLOWED.send(send)
 
     return app
@@ -4,48 +4,86 @@ This module provides utilities for parsing and validating query parameters
 that are common across different framework adapters (ASGI, WSGI).
 """
 
+import math
+from urllib.parse import unquote_to_bytes
+
 # Valid log levels for validation
-VALID_LEVELS = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
+VALID_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
 
+# Raw level bytes, lower- and uppercase -> canonical level name, so the usual
+# spellings resolve with one lookup and no case conversion
+_LEVEL_BYTES = {level.lower().encode(): level for level in VALID_LEVELS} | {
+    level.encode(): level for level in VALID_LEVELS
+}
 
-def _parse_since_param(params: dict[str, list[str]]) -> float:
-    """Parse and validate the 'since' query parameter.
 
-    Args:
-        params: Parsed query string parameters (as returned by urllib.parse.parse_qs).
+def _parse_since_value(raw: str | bytes) -> float:
+    """Convert a raw 'since' value to a timestamp.
 
-    Returns:
-        Timestamp as float, defaulting to 0.0 if invalid or missing.
-        Rejects negative, NaN, and infinite values, returning 0.0 for these cases.
+    Returns 0.0 for unparseable, negative, NaN, and infinite values.
     """
-    # @tra: Adapter.ASGI.QueryParameter.InvalidUTF8
-    # @tra: Adapter.ASGI.QueryParameter.SinceValidation
     try:
-        value = float(params.get("since", ["0"])[0])
-        # Reject negative, NaN, and infinite values
-        if (
-            value < 0
-            or value != value
-            or value == float("inf")
-            or value == float("-inf")
-        ):
-            return 0.0
-        return value
+        # Integer epochs are the common case and need no float parsing
+        number = int(raw)
     except ValueError:
-        return 0.0
+        try:
+            value = float(raw)
+        except ValueError:
+            return 0.0
+        # Reject NaN and infinite values
+        if not math.isfinite(value):
+            return 0.0
+    else:
+        try:
+            value = float(number)
+        except OverflowError:
+            return 0.0
+    return value if value >= 0 else 0.0
+
 
+def _parse_params(query_string: bytes) -> tuple[float, str | None]:
+    """Parse the 'since' and 'level' parameters from a raw query string.
 
-def _parse_level_param(params: dict[str, list[str]]) -> str | None:
-    """Parse and validate the 'level' query parameter.
+    Scans the ``&``-separated pairs once, without decoding the whole string
+    or building the dict of lists that ``urllib.parse.parse_qs`` returns.
+    Matches parse_qs semantics for these two parameters: blank values are
+    ignored, the first occurrence wins, and percent-escapes are decoded
+    (only for pairs that contain them).
 
     Args:
-        params: Parsed query string parameters (as returned by urllib.parse.parse_qs).
+        query_string: Raw query string bytes (e.g. ASGI ``scope["query_string"]``).
 
     Returns:
-        Validated level string (uppercase) or None if invalid/missing.
+        Tuple of (since, level). since defaults to 0.0 and level to None
+        when missing or invalid.
+
+    Example:
+        >>> _parse_params(b"since=12.5&level=error&other=1")
+        (12.5, 'ERROR')
+        >>> _parse_params(b"")
+        (0.0, None)
     """
-    level_list = params.get("level", [None])
-    level_raw = level_list[0] if level_list else None
-    if level_raw and level_raw.upper() in VALID_LEVELS:
-        return level_raw.upper()
-    return None
+    # @tra: Adapter.ASGI.QueryParameter.Parser
+    # @tra: Adapter.ASGI.QueryParameter.InvalidUTF8
+    if not query_string:
+        return 0.0, None
+    since: float | None = None
+    level: str | None = None
+    level_seen = False
+    for pair in query_string.split(b"&"):
+        name, _, value = pair.partition(b"=")
+        if b"%" in pair or b"+" in pair:
+            name = unquote_to_bytes(name.replace(b"+", b" "))
+            value = unquote_to_bytes(value.replace(b"+", b" "))
+        if not value:
+            continue
+        if name == b"since" and since is None:
+            # @tra: Adapter.ASGI.QueryParameter.SinceValidation
+            since = _parse_since_value(value)
+        elif name == b"level" and not level_seen:
+            level_seen = True
+            level = _LEVEL_BYTES.get(value)
+            if level is None:
+                # Mixed case such as "Error" is rare; normalise only then
+                level = _LEVEL_BYTES.get(value.lower())
+    return (0.0 if since is None else since), level
@@ -11,12 +11,8 @@ boundary rather than creating a new loop per request.
 
 from collections.abc import Callable, Iterable
 from typing import Any
-from urllib.parse import parse_qs
 
-from observabilipy.adapters.frameworks.query_params import (
-    _parse_level_param,
-    _parse_since_param,
-)
+from observabilipy.adapters.frameworks.query_params import _parse_params
 from observabilipy.adapters.storage import collect_async_iterable
 from observabilipy.core.encoding.ndjson import encode_logs_sync, encode_ndjson_sync
 from observabilipy.core.encoding.prometheus import encode_current_sync
@@ -27,6 +23,15 @@ StartResponse = Callable[[str, list[tuple[str, str]]], Callable[[bytes], object]
 WSGIApp = Callable[[dict[str, Any], StartResponse], Iterable[bytes]]
 
 
+def _query_bytes(environ: dict[str, Any]) -> bytes:
+    """Return the raw query string bytes from a WSGI environ.
+
+    PEP 3333 passes QUERY_STRING as a latin-1 decoded native string, so
+    encoding it back with latin-1 recovers the original bytes.
+    """
+    return str(environ.get("QUERY_STRING", "")).encode("latin-1", errors="replace")
+
+
 def create_wsgi_app(
     log_storage: LogStoragePort,
     metrics_storage: MetricsStoragePort,
@@ -41,59 +46,58 @@ def create_wsgi_app(
         WSGI application callable.
     """
 
+    # @tra: Adapter.WSGI.MetricsEndpointReturnsStatus
+    # @tra: Adapter.WSGI.MetricsEndpointContentType
+    # @tra: Adapter.WSGI.MetricsEndpointNDJSON
+    # @tra: Adapter.WSGI.MetricsEndpointSinceFilter
+    # @tra: Adapter.WSGI.MetricsEmptyStorage
+    # @tra: Adapter.WSGI.MetricsInvalidSinceParam
+    def handle_metrics(environ: dict[str, Any]) -> tuple[str, str]:
+        since, _ = _parse_params(_query_bytes(environ))
+        samples = collect_async_iterable(metrics_storage.read(since=since))
+        return "application/x-ndjson", encode_ndjson_sync(samples)
+
+    # @tra: Adapter.WSGI.PrometheusEndpointReturnsStatus
+    # @tra: Adapter.WSGI.PrometheusEndpointContentType
+    # @tra: Adapter.WSGI.PrometheusEndpointFormat
+    # @tra: Adapter.WSGI.PrometheusEndpointLatestOnly
+    # @tra: Adapter.WSGI.PrometheusEndpointEmptyStorage
+    def handle_prometheus(environ: dict[str, Any]) -> tuple[str, str]:
+        samples = collect_async_iterable(metrics_storage.read())
+        body = encode_current_sync(samples)
+        return "text/plain; version=0.0.4; charset=utf-8", body
+
+    # @tra: Adapter.WSGI.LogsEndpointReturnsStatus
+    # @tra: Adapter.WSGI.LogsEndpointContentType
+    # @tra: Adapter.WSGI.LogsEndpointNDJSON
+    # @tra: Adapter.WSGI.LogsEndpointSinceFilter
+    # @tra: Adapter.WSGI.LogsEndpointLevelFilter
+    # @tra: Adapter.WSGI.LogsEndpointLevelFilterCaseInsensitive
+    # @tra: Adapter.WSGI.LogsEndpointCombinedFilters
+    # @tra: Adapter.WSGI.LogsEndpointInvalidLevel
+    # @tra: Adapter.WSGI.LogsEmptyStorage
+    # @tra: Adapter.WSGI.LogsInvalidSinceParam
+    # @tra: Adapter.WSGI.LogsInvalidLevelParam
+    def handle_logs(environ: dict[str, Any]) -> tuple[str, str]:
+        since, level = _parse_params(_query_bytes(environ))
+        entries = collect_async_iterable(log_storage.read(since=since, level=level))
+        return "application/x-ndjson", encode_logs_sync(entries)
+
+    # Built once per app so each request is a single hashed lookup
+    routes: dict[str, Callable[[dict[str, Any]], tuple[str, str]]] = {
+        "/metrics": handle_metrics,
+        "/metrics/prometheus": handle_prometheus,
+        "/logs": handle_logs,
+    }
+
     def app(environ: dict[str, Any], start_response: StartResponse) -> Iterable[bytes]:
-        path = environ.get("PATH_INFO", "/")
-
-        if path == "/metrics":
-            # @tra: Adapter.WSGI.MetricsEndpointReturnsStatus
-            # @tra: Adapter.WSGI.MetricsEndpointContentType
-            # @tra: Adapter.WSGI.MetricsEndpointNDJSON
-            # @tra: Adapter.WSGI.MetricsEndpointSinceFilter
-            # @tra: Adapter.WSGI.MetricsEmptyStorage
-            # @tra: Adapter.WSGI.MetricsInvalidSinceParam
-            headers = [("Content-Type", "application/x-ndjson")]
-            query_string = environ.get("QUERY_STRING", "")
-            params = parse_qs(query_string)
-            since = _parse_since_param(params)
-            samples = collect_async_iterable(metrics_storage.read(since=since))
-            body = encode_ndjson_sync(samples)
-            start_response("200 OK", headers)
-            return [body.encode()]
-        if path == "/metrics/prometheus":
-            # @tra: Adapter.WSGI.PrometheusEndpointReturnsStatus
-            # @tra: Adapter.WSGI.PrometheusEndpointContentType
-            # @tra: Adapter.WSGI.PrometheusEndpointFormat
-            # @tra: Adapter.WSGI.PrometheusEndpointLatestOnly
-            # @tra: Adapter.WSGI.PrometheusEndpointEmptyStorage
-            headers = [("Content-Type", "text/plain; version=0.0.4; charset=utf-8")]
-            samples = collect_async_iterable(metrics_storage.read())
-            body = encode_current_sync(samples)
-            start_response("200 OK", headers)
-            return [body.encode()]
-        if path == "/logs":
-            # @tra: Adapter.WSGI.LogsEndpointReturnsStatus
-            # @tra: Adapter.WSGI.LogsEndpointContentType
-            # @tra: Adapter.WSGI.LogsEndpointNDJSON
-            # @tra: Adapter.WSGI.LogsEndpointSinceFilter
-            # @tra: Adapter.WSGI.LogsEndpointLevelFilter
-            # @tra: Adapter.WSGI.LogsEndpointLevelFilterCaseInsensitive
-            # @tra: Adapter.WSGI.LogsEndpointCombinedFilters
-            # @tra: Adapter.WSGI.LogsEndpointInvalidLevel
-            # @tra: Adapter.WSGI.LogsEmptyStorage
-            # @tra: Adapter.WSGI.LogsInvalidSinceParam
-            # @tra: Adapter.WSGI.LogsInvalidLevelParam
-            headers = [("Content-Type", "application/x-ndjson")]
-            query_string = environ.get("QUERY_STRING", "")
-            params = parse_qs(query_string)
-            since = _parse_since_param(params)
-            level = _parse_level_param(params)
-            log_entries = log_storage.read(since=since, level=level)
-            entries = collect_async_iterable(log_entries)
-            body = encode_logs_sync(entries)
-            start_response("200 OK", headers)
-            return [body.encode()]
+        handler = routes.get(environ.get("PATH_INFO", "/"))
         # @tra: Adapter.WSGI.Routing404NotFound
-        start_response("404 Not Found", [])
-        return [b"Not Found"]
+        if handler is None:
+            start_response("404 Not Found", [])
+            return [b"Not Found"]
+        content_type, body = handler(environ)
+        start_response("200 OK", [("Content-Type", content_type)])
+        return [body.encode()]
 
     return app
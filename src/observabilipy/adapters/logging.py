@@ -9,10 +9,13 @@ import logging
 import queue
 import threading
 import traceback
+import weakref
 from collections.abc import Callable
+from operator import attrgetter
 
 from observabilipy.core.models import LogEntry
 from observabilipy.core.ports import LogStoragePort
+from observabilipy.core.services import _write_all
 
 # Type alias for context provider callable
 ContextProvider = Callable[[], dict[str, str | int | float | bool]]
@@ -47,8 +50,25 @@ _STANDARD_LOGRECORD_ATTRS = frozenset(
 )
 
 
+# Extra attribute value types stored as-is. Exact types hit the set lookup;
+# subclasses (e.g. StrEnum members) still pass through the isinstance check.
+_ATTR_VALUE_TUPLE = (str, int, float, bool)
+_ATTR_VALUE_TYPES = frozenset(_ATTR_VALUE_TUPLE)
+
+
 # Default attributes to extract from LogRecord
-_DEFAULT_INCLUDE_ATTRS = ["module", "funcName", "lineno", "pathname"]
+_DEFAULT_INCLUDE_ATTRS = ("module", "funcName", "lineno", "pathname")
+
+# Readers for the include_attrs keys the handler supports
+_ATTR_GETTERS: dict[str, Callable[[logging.LogRecord], str | int | float | bool]] = {
+    "module": attrgetter("name"),
+    "funcName": lambda record: record.funcName or "",
+    "lineno": attrgetter("lineno"),
+    "pathname": attrgetter("pathname"),
+}
+
+# Upper bound on entries the background writer stores per write_many() call
+_MAX_WRITE_BATCH = 500
 
 
 class ObservabilipyHandler(logging.Handler):
@@ -86,10 +106,25 @@ class ObservabilipyHandler(logging.Handler):
         """
         super().__init__()
         self._storage = storage
-        self._include_attrs = include_attrs or _DEFAULT_INCLUDE_ATTRS
+        # Copied so later changes to the caller's list cannot affect the handler
+        self._include_attrs = (
+            tuple(include_attrs) if include_attrs else _DEFAULT_INCLUDE_ATTRS
+        )
+        # Resolved once so emit() only reads the configured attributes
+        self._attr_getters = tuple(
+            (key, _ATTR_GETTERS[key])
+            for key in self._include_attrs
+            if key in _ATTR_GETTERS
+        )
         self._context_provider = context_provider
         self._background_writer = background_writer
 
+        # Private event loop for direct writes made outside any running loop,
+        # created on first use and reused for every later record. The
+        # finalizer closes it even if the handler is never closed.
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_finalizer: weakref.finalize[[], ObservabilipyHandler] | None = None
+
         # Background writer state
         self._queue: queue.Queue[LogEntry | None] | None = None
         self._writer_thread: threading.Thread | None = None
@@ -108,30 +143,30 @@ class ObservabilipyHandler(logging.Handler):
         Args:
             record: The log record to emit.
         """
-        # Map of attribute names to their values from LogRecord
-        attr_mapping: dict[str, str | int | float | bool] = {
-            "module": record.name,
-            "funcName": record.funcName or "",
-            "lineno": record.lineno,
-            "pathname": record.pathname,
-        }
-
-        # Start with context provider attributes (lowest precedence)
-        attributes: dict[str, str | int | float | bool] = {}
-        if self._context_provider is not None:
+        # Build the include_attrs attributes in one comprehension; context
+        # provider attributes have the lowest precedence, so they go first.
+        attributes: dict[str, str | int | float | bool]
+        if self._context_provider is None:
+            attributes = {key: getter(record) for key, getter in self._attr_getters}
+        else:
             attributes = self._context_provider().copy()
+            attributes.update(
+                (key, getter(record)) for key, getter in self._attr_getters
+            )
 
-        # Add attributes based on include_attrs configuration (overrides context)
-        for key in self._include_attrs:
-            if key in attr_mapping:
-                attributes[key] = attr_mapping[key]
-
-        # Add any extra attributes passed via logging call (highest precedence)
-        for key, value in record.__dict__.items():
-            if key not in _STANDARD_LOGRECORD_ATTRS and isinstance(
-                value, str | int | float | bool
-            ):
-                attributes[key] = value
+        # Add any extra attributes passed via logging call (highest precedence).
+        # Most records carry none, and the C-level key difference finds that
+        # out without a Python loop over every standard attribute.
+        record_dict = record.__dict__
+        extra_keys = record_dict.keys() - _STANDARD_LOGRECORD_ATTRS
+        if extra_keys:
+            # Iterate the record itself to keep the caller's key order
+            for key, value in record_dict.items():
+                if key in extra_keys and (
+                    type(value) in _ATTR_VALUE_TYPES
+                    or isinstance(value, _ATTR_VALUE_TUPLE)
+                ):
+                    attributes[key] = value
 
         # Extract exception info if present
         if record.exc_info:
@@ -141,6 +176,9 @@ class ObservabilipyHandler(logging.Handler):
             if exc_value is not None:
                 attributes["exc_message"] = str(exc_value)
             if exc_tb is not None:
+                # Not record.exc_text: that cache holds whatever the first
+                # handler's formatter produced, so stored text would depend
+                # on handler order and configuration
                 attributes["exc_traceback"] = "".join(
                     traceback.format_exception(exc_type, exc_value, exc_tb)
                 )
@@ -166,25 +204,45 @@ class ObservabilipyHandler(logging.Handler):
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError:
-            # No running event loop - use asyncio.run() (sync context)
-            asyncio.run(self._storage.write(entry))
+            # No running event loop (sync context) - run the write on the
+            # handler's own loop instead of building a new one per record
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._loop_finalizer = weakref.finalize(self, self._loop.close)
+            self._loop.run_until_complete(self._storage.write(entry))
         else:
             # Inside a running event loop - schedule as a task
             loop.create_task(self._storage.write(entry))
 
     def _background_write_loop(self) -> None:
-        """Background thread that processes the write queue."""
+        """Background thread that processes the write queue.
+
+        Entries that queued up while the previous write was running are
+        drained together and stored with one write_many() call, or one
+        write() each for storages without the batch method.
+        """
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
+        assert self._queue is not None
 
         while True:
-            assert self._queue is not None
             entry = self._queue.get()
-            if entry is None:  # Shutdown signal
+            batch: list[LogEntry] = []
+            while entry is not None:
+                batch.append(entry)
+                if len(batch) == _MAX_WRITE_BATCH:
+                    break
+                try:
+                    entry = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                loop.run_until_complete(_write_all(self._storage, batch))
+            # Mark items done only after the write, so flush() waits for it
+            for _ in range(len(batch) + (entry is None)):
                 self._queue.task_done()
+            if entry is None:  # Shutdown signal
                 break
-            loop.run_until_complete(self._storage.write(entry))
-            self._queue.task_done()
 
         loop.close()
 
@@ -205,4 +263,8 @@ class ObservabilipyHandler(logging.Handler):
             self._queue.put(None)  # Shutdown signal
             if self._writer_thread is not None:
                 self._writer_thread.join(timeout=5.0)
+        if self._loop_finalizer is not None:
+            self._loop_finalizer()  # Closes the loop and detaches the finalizer
+            self._loop_finalizer = None
+            self._loop = None
         super().close()
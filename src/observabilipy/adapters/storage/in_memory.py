@@ -1,10 +1,14 @@
 """In-memory storage adapters for logs and metrics."""
 
-from collections.abc import AsyncIterable
+from collections.abc import AsyncIterable, Iterable
+from operator import attrgetter
 from typing import Protocol, runtime_checkable
 
 from observabilipy.core.models import LogEntry, MetricSample
 
+# Shared sort key for read(); avoids building a lambda on every call
+_BY_TIMESTAMP = attrgetter("timestamp")
+
 
 @runtime_checkable
 class Timestamped(Protocol):
@@ -36,6 +40,10 @@ class InMemoryStorage[T: Timestamped]:
         """Synchronous write for testing contexts."""
         self._items.append(item)
 
+    async def write_many(self, items: Iterable[T]) -> None:
+        """Write a batch of items to storage."""
+        self._items.extend(items)
+
     def write_sync_batch(self, items: list[T]) -> None:
         """Synchronous batch write for testing contexts."""
         self._items.extend(items)
@@ -64,7 +72,7 @@ class InMemoryStorage[T: Timestamped]:
         Protected helper for subclass read() implementations.
         """
         filtered = [item for item in self._items if item.timestamp > since]
-        return sorted(filtered, key=lambda item: item.timestamp)
+        return sorted(filtered, key=_BY_TIMESTAMP)
 
 
 class InMemoryLogStorage(InMemoryStorage[LogEntry]):
@@ -6,11 +6,16 @@ need predictable memory usage.
 """
 
 from collections import deque
-from collections.abc import AsyncIterable
+from collections.abc import AsyncIterable, Iterable
+from itertools import islice
+from operator import attrgetter
 
 from observabilipy.core.exceptions import ConfigurationError
 from observabilipy.core.models import LogEntry, MetricSample
 
+# Shared sort key for read(); avoids building a lambda on every call
+_BY_TIMESTAMP = attrgetter("timestamp")
+
 
 # @tra: Adapter.RingBufferStorage.ImplementsLogStoragePort
 class RingBufferLogStorage:
@@ -49,6 +54,10 @@ class RingBufferLogStorage:
         """Synchronous write for non-async contexts (testing, WSGI)."""
         self._buffer.append(entry)
 
+    async def write_many(self, entries: Iterable[LogEntry]) -> None:
+        """Write a batch of log entries to storage."""
+        self._buffer.extend(entries)
+
     async def clear(self) -> None:
         """Clear all entries from storage."""
         self._buffer.clear()
@@ -70,9 +79,19 @@ class RingBufferLogStorage:
         if level is not None:
             level_upper = level.upper()
             filtered = [e for e in filtered if e.level.upper() == level_upper]
-        for entry in sorted(filtered, key=lambda e: e.timestamp):
+        for entry in sorted(filtered, key=_BY_TIMESTAMP):
             yield entry
 
+    async def read_latest(self, limit: int) -> list[LogEntry]:
+        """Return up to limit most recently written entries, newest first.
+
+        Entries come back in reverse write order, not sorted by timestamp:
+        an entry written late with an older timestamp still counts as one of
+        the latest. Walks the buffer from its tail, so the cost is O(limit)
+        regardless of how many entries are stored.
+        """
+        return list(islice(reversed(self._buffer), max(limit, 0)))
+
     async def count(self) -> int:
         """Return total number of log entries in storage."""
         return len(self._buffer)
@@ -138,6 +157,10 @@ class RingBufferMetricsStorage:
         """Synchronous write for non-async contexts (testing, WSGI)."""
         self._buffer.append(sample)
 
+    async def write_many(self, samples: Iterable[MetricSample]) -> None:
+        """Write a batch of metric samples to storage."""
+        self._buffer.extend(samples)
+
     async def clear(self) -> None:
         """Clear all samples from storage."""
         self._buffer.clear()
@@ -152,7 +175,7 @@ class RingBufferMetricsStorage:
         Returns samples with timestamp > since, ordered by timestamp ascending.
         """
         filtered = [s for s in self._buffer if s.timestamp > since]
-        for sample in sorted(filtered, key=lambda s: s.timestamp):
+        for sample in sorted(filtered, key=_BY_TIMESTAMP):
             yield sample
 
     async def count(self) -> int:
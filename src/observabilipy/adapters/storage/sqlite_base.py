@@ -2,14 +2,61 @@
 
 import asyncio
 import json
+import os
 import sqlite3
 import threading
-from collections.abc import AsyncIterator, Iterator
+import uuid
+import weakref
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
 from contextlib import asynccontextmanager, contextmanager
 from typing import Any
 
 import aiosqlite
 
+# orjson is an optional speedup for the per-row attribute/label parsing
+_fast_json_loads: Callable[[str], Any]
+try:
+    from orjson import (  # type: ignore[import-not-found,unused-ignore]
+        loads as _fast_json_loads,
+    )
+except ImportError:
+    _fast_json_loads = json.loads
+
+# Compact JSON for the attributes/labels columns: no separator spaces, so
+# rows are smaller on disk and still plain JSON for any reader. The encoder
+# is built once; json.dumps would build a new one per call for these options.
+_json_dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+# Per-connection settings for file databases (SQLite does not persist them).
+# With WAL, synchronous=NORMAL syncs at checkpoints instead of every commit
+# and stays crash-safe; temp_store keeps sort/index temporaries off disk.
+# Pooled connections live long enough for a larger page cache (20 MB) and
+# memory-mapped reads (up to 256 MB) to pay off. The busy timeout is not
+# set here: sqlite3.connect() already installs a 5 second one.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL; PRAGMA temp_store=MEMORY; "
+    "PRAGMA cache_size=-20000; PRAGMA mmap_size=268435456;"
+)
+
+# Rows fetched per trip to the aiosqlite connection thread while iterating
+# a cursor (aiosqlite's default is 64); large reads are dominated by trips
+_ITER_CHUNK_SIZE = 1000
+
+# Rows removed per transaction by delete_before(). Large retention sweeps
+# commit in steps, so no single transaction holds the write lock for long
+# or grows the WAL by the whole sweep.
+_DELETE_BATCH_SIZE = 5000
+
+# Idle file database connections each manager keeps open for reuse
+_MAX_IDLE_CONNECTIONS = 4
+
+# Schema initialization locks, one per event loop and shared by all async
+# managers. An asyncio.Lock binds to the loop it is first contended on, and
+# a storage may be used from more than one loop.
+_INIT_LOCKS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+    weakref.WeakKeyDictionary()
+)
+
 
 def _safe_json_loads(
     data: str, default: dict[str, Any] | None = None
@@ -22,14 +69,53 @@ def _safe_json_loads(
 
     Returns:
         Parsed JSON as dict, or default if parsing fails.
+
+    Example:
+        >>> _safe_json_loads('{"a":1}')
+        {'a': 1}
+        >>> _safe_json_loads("{}")
+        {}
     """
+    if data == "{}":
+        # Most rows carry no attributes/labels; skip the parser for them.
+        # A fresh dict each time, since callers may mutate the result.
+        return {}
     if default is None:
         default = {}
     try:
-        result: dict[str, Any] = json.loads(data)
-        return result
-    except json.JSONDecodeError:
-        return default
+        result: dict[str, Any] = _fast_json_loads(data)
+    except ValueError:
+        # orjson rejects NaN/Infinity and integers beyond 64 bits, all of
+        # which json.dumps writes, so retry with the stdlib before giving up
+        try:
+            result = json.loads(data)
+        except json.JSONDecodeError:
+            return default
+    return result
+
+
+def _shared_memory_uri() -> str:
+    """Return a URI for a new in-memory database any connection can open.
+
+    SQLite's memdb VFS keeps the database alive while any connection to it
+    is open and, unlike shared-cache mode, uses normal file locking, so the
+    busy timeout applies between connections.
+    """
+    return f"file:/observabilipy-{uuid.uuid4().hex}?vfs=memdb"
+
+
+async def _fetch_count(
+    db: aiosqlite.Connection, query: str, params: tuple[Any, ...] = ()
+) -> int:
+    """Run a COUNT query and return its result.
+
+    Uses one trip to the aiosqlite connection thread, where execute, fetch,
+    and cursor close would take three.
+    """
+    for row in await db.execute_fetchall(query, params):
+        count: int = row[0]
+        return count
+    return 0
 
 
 class AsyncConnectionManager:
@@ -37,68 +123,103 @@ class AsyncConnectionManager:
 
     Handles schema initialization and connection lifecycle for async contexts.
     For :memory: databases, maintains a persistent connection since SQLite
-    in-memory databases are connection-scoped.
+    in-memory databases are connection-scoped. For file databases, returned
+    connections are kept in a small idle pool and reused. A forked child
+    starts with an empty pool.
     """
 
-    def __init__(self, db_path: str, schema: str) -> None:
+    def __init__(self, db_path: str, schema: str, uri: bool = False) -> None:
         self._db_path = db_path
         self._schema = schema
+        self._uri = uri
         self._initialized = False
-        self._init_lock: asyncio.Lock | None = None
+        # The per-loop asyncio locks only order coroutines on one loop; this
+        # one keeps threads running separate loops from initializing twice
+        self._init_thread_lock = threading.Lock()
         self._persistent_conn: aiosqlite.Connection | None = None
+        self._idle: list[aiosqlite.Connection] = []
+        if self._pools_connections:
+            _POOLING_MANAGERS.add(self)
 
     def _get_lock(self) -> asyncio.Lock:
-        """Get or create the initialization lock (lazy to avoid event loop issues)."""
-        if self._init_lock is None:
-            self._init_lock = asyncio.Lock()
-        return self._init_lock
+        """Get or create the initialization lock for the running event loop."""
+        loop = asyncio.get_running_loop()
+        lock = _INIT_LOCKS.get(loop)
+        if lock is None:
+            lock = _INIT_LOCKS[loop] = asyncio.Lock()
+        return lock
 
     @property
-    def _should_close_connection(self) -> bool:
-        """Return True if connections should be closed after use."""
-        return self._db_path != ":memory:"
+    def _pools_connections(self) -> bool:
+        """Return True if connections are pooled rather than persistent."""
+        return self._db_path != ":memory:" and not self._uri
 
     async def _ensure_initialized(self) -> None:
         """Initialize database schema once."""
         if self._initialized:
             return
         async with self._get_lock():
-            if self._initialized:
-                return
-            if self._db_path == ":memory:":
-                self._persistent_conn = await aiosqlite.connect(":memory:")
-                await self._persistent_conn.executescript(self._schema)
-            else:
-                async with aiosqlite.connect(self._db_path) as db:
-                    await db.execute("PRAGMA journal_mode=WAL")
-                    await db.executescript(self._schema)
-            self._initialized = True
+            # Blocks this loop only while another thread runs the one-time init
+            with self._init_thread_lock:
+                if self._initialized:
+                    return
+                if not self._pools_connections:
+                    self._persistent_conn = await aiosqlite.connect(
+                        self._db_path, uri=self._uri, iter_chunk_size=_ITER_CHUNK_SIZE
+                    )
+                    await self._persistent_conn.executescript(self._schema)
+                else:
+                    async with aiosqlite.connect(self._db_path) as db:
+                        await db.execute("PRAGMA journal_mode=WAL")
+                        await db.executescript(self._schema)
+                self._initialized = True
 
     async def _get_connection(self) -> aiosqlite.Connection:
         """Get a database connection."""
-        await self._ensure_initialized()
-        if self._db_path == ":memory:":
+        # Checked here too so initialized managers skip creating a coroutine
+        if not self._initialized:
+            await self._ensure_initialized()
+        if not self._pools_connections:
             if self._persistent_conn is None:
                 raise RuntimeError("Memory database connection not initialized")
             return self._persistent_conn
-        return await aiosqlite.connect(self._db_path)
+        if self._idle:
+            return self._idle.pop()
+        db = aiosqlite.connect(self._db_path, iter_chunk_size=_ITER_CHUNK_SIZE)
+        # Each connection runs a thread; idle pooled ones must not keep the
+        # interpreter alive at exit when the storage is never closed
+        db.daemon = True
+        await db
+        await db.executescript(_CONNECTION_PRAGMAS)
+        return db
 
     @asynccontextmanager
     async def connection(self) -> AsyncIterator[aiosqlite.Connection]:
         """Context manager for async database connections.
 
-        Automatically closes connections for file-based databases.
-        For :memory: databases, keeps connections open (they're persistent).
+        File database connections go back to the idle pool on success and
+        are closed if the block raised, so no half-finished transaction is
+        reused. For :memory: databases, keeps connections open (they're
+        persistent).
         """
         db = await self._get_connection()
+        if not self._pools_connections:
+            yield db
+            return
         try:
             yield db
-        finally:
-            if self._should_close_connection:
-                await db.close()
+        except BaseException:
+            await db.close()
+            raise
+        if len(self._idle) < _MAX_IDLE_CONNECTIONS:
+            self._idle.append(db)
+        else:
+            await db.close()
 
     async def close(self) -> None:
-        """Close persistent connection (for :memory: databases)."""
+        """Close idle pooled connections and the :memory: persistent one."""
+        while self._idle:
+            await self._idle.pop().close()
         if self._persistent_conn is not None:
             await self._persistent_conn.close()
             self._persistent_conn = None
@@ -112,22 +233,30 @@ class SyncConnectionManager:
     For :memory: databases, maintains a persistent connection since SQLite
     in-memory databases are connection-scoped.
 
+    For file databases, returned connections are kept in a small idle pool
+    and reused, possibly by a different thread than the one that opened them.
+    A forked child starts with an empty pool.
+
     IMPORTANT: For :memory: databases, this manager maintains a completely
     separate database instance from AsyncConnectionManager. This is intentional
     for thread-safety in concurrent scenarios.
     """
 
-    def __init__(self, db_path: str, schema: str) -> None:
+    def __init__(self, db_path: str, schema: str, uri: bool = False) -> None:
         self._db_path = db_path
         self._schema = schema
+        self._uri = uri
         self._initialized = False
         self._lock = threading.Lock()
         self._persistent_conn: sqlite3.Connection | None = None
+        self._idle: list[sqlite3.Connection] = []
+        if self._pools_connections:
+            _POOLING_MANAGERS.add(self)
 
     @property
-    def _should_close_connection(self) -> bool:
-        """Return True if connections should be closed after use."""
-        return self._db_path != ":memory:"
+    def _pools_connections(self) -> bool:
+        """Return True if connections are pooled rather than persistent."""
+        return self._db_path != ":memory:" and not self._uri
 
     def _ensure_initialized(self) -> None:
         """Initialize database schema synchronously."""
@@ -136,8 +265,8 @@ class SyncConnectionManager:
         with self._lock:
             if self._initialized:
                 return
-            if self._db_path == ":memory:":
-                self._persistent_conn = sqlite3.connect(":memory:")
+            if not self._pools_connections:
+                self._persistent_conn = sqlite3.connect(self._db_path, uri=self._uri)
                 self._persistent_conn.executescript(self._schema)
             else:
                 with sqlite3.connect(self._db_path) as db:
@@ -148,25 +277,80 @@ class SyncConnectionManager:
     def _get_connection(self) -> sqlite3.Connection:
         """Get a sync database connection."""
         self._ensure_initialized()
-        if self._db_path == ":memory:":
+        if not self._pools_connections:
             if self._persistent_conn is None:
                 raise RuntimeError("Sync memory database connection not initialized")
             return self._persistent_conn
-        return sqlite3.connect(self._db_path)
+        try:
+            # pop() is atomic, so threads never share an idle connection
+            return self._idle.pop()
+        except IndexError:
+            pass
+        # The pool hands a connection to one thread at a time, but not always
+        # to the thread that opened it
+        conn = sqlite3.connect(self._db_path, check_same_thread=False)
+        conn.executescript(_CONNECTION_PRAGMAS)
+        return conn
 
     @contextmanager
     def connection(self) -> Iterator[sqlite3.Connection]:
         """Context manager for sync database connections.
 
-        Automatically closes connections for file-based databases.
-        For :memory: databases, keeps connections open (they're persistent).
+        File database connections go back to the idle pool on success and
+        are closed if the block raised, so no half-finished transaction is
+        reused. For :memory: databases, keeps connections open (they're
+        persistent).
         """
         conn = self._get_connection()
+        if not self._pools_connections:
+            yield conn
+            return
         try:
             yield conn
-        finally:
-            if self._should_close_connection:
-                conn.close()
+        except BaseException:
+            conn.close()
+            raise
+        if len(self._idle) < _MAX_IDLE_CONNECTIONS:
+            self._idle.append(conn)
+        else:
+            conn.close()
+
+    def close(self) -> None:
+        """Close idle pooled connections."""
+        while self._idle:
+            self._idle.pop().close()
+
+
+# Managers with an idle pool, so a forked child can drop the inherited pools
+_POOLING_MANAGERS: weakref.WeakSet[AsyncConnectionManager | SyncConnectionManager] = (
+    weakref.WeakSet()
+)
+
+# Pooled connections inherited across os.fork(). SQLite forbids using them in
+# the child, and even closing one there may checkpoint or delete the parent's
+# WAL file, so they are parked here and never touched again.
+_FORK_ORPHANS: list[aiosqlite.Connection | sqlite3.Connection] = []
+
+
+def _abandon_pools_after_fork() -> None:
+    """Empty every idle pool in a forked child without closing connections."""
+    for manager in _POOLING_MANAGERS:
+        _FORK_ORPHANS.extend(manager._idle)
+        manager._idle = []
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_abandon_pools_after_fork)
+
+
+class _PendingWrites:
+    """Rows from concurrent write() calls waiting to share one transaction."""
+
+    __slots__ = ("rows", "task")
+
+    def __init__(self, rows: list[tuple[Any, ...]], task: asyncio.Task[None]) -> None:
+        self.rows = rows
+        self.task = task
 
 
 class SQLiteStorageBase:
@@ -185,17 +369,27 @@ class SQLiteStorageBase:
     intentional and required for thread-safety in concurrent test scenarios.
 
     For testing, use fixtures that isolate sync and async operations.
+    Pass shared_memory=True to have both managers open one in-memory
+    database instead, so sync and async methods see the same rows. It has
+    no effect on file databases, which are always shared.
     """
 
-    def __init__(self, db_path: str, schema: str) -> None:
+    def __init__(self, db_path: str, schema: str, shared_memory: bool = False) -> None:
         self._db_path = db_path
         self._schema = schema
-        self._async_manager = AsyncConnectionManager(db_path, schema)
-        self._sync_manager = SyncConnectionManager(db_path, schema)
+        uri = shared_memory and db_path == ":memory:"
+        connect_path = _shared_memory_uri() if uri else db_path
+        self._async_manager = AsyncConnectionManager(connect_path, schema, uri)
+        self._sync_manager = SyncConnectionManager(connect_path, schema, uri)
+        # Batch of async writes currently being collected, per event loop
+        self._pending_writes: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _PendingWrites
+        ] = weakref.WeakKeyDictionary()
 
     async def close(self) -> None:
-        """Close persistent connection (for :memory: databases)."""
+        """Close pooled connections and the :memory: persistent connection."""
         await self._async_manager.close()
+        self._sync_manager.close()
 
     # --- Connection context managers (delegate to managers) ---
 
@@ -246,32 +440,79 @@ class SQLiteStorageGeneric(SQLiteStorageBase):
         raise NotImplementedError
 
     async def _write(self, item: Any) -> None:
-        """Write an item to storage."""
+        """Write an item to storage.
+
+        Writes issued concurrently on one event loop (e.g. from several
+        request tasks) are coalesced: the first caller starts a flush task
+        that runs once the callers already scheduled have added their rows,
+        then commits them all in a single transaction. Every caller returns
+        only once its row is committed, or raises if the shared transaction
+        failed. The flush runs in its own task and callers await it shielded,
+        so cancelling any caller, the first included, does not drop the
+        batch.
+        """
+        row = self._to_row(item)
+        loop = asyncio.get_running_loop()
+        pending = self._pending_writes.get(loop)
+        if pending is None:
+            rows = [row]
+            task = loop.create_task(self._flush_pending(loop, rows))
+            self._pending_writes[loop] = _PendingWrites(rows, task)
+        else:
+            pending.rows.append(row)
+            task = pending.task
+        await asyncio.shield(task)
+
+    async def _flush_pending(
+        self, loop: asyncio.AbstractEventLoop, rows: list[tuple[Any, ...]]
+    ) -> None:
+        """Commit a batch of coalesced write() rows; later writes start anew."""
+        del self._pending_writes[loop]
+        await self._insert_rows(rows)
+
+    async def _write_many(self, items: Iterable[Any]) -> None:
+        """Write a batch of items in a single transaction."""
+        rows = [self._to_row(item) for item in items]
+        if rows:
+            await self._insert_rows(rows)
+
+    async def _insert_rows(self, rows: list[tuple[Any, ...]]) -> None:
+        """Insert rows in a single transaction."""
         async with self.async_connection() as db:
-            await db.execute(self._insert_query, self._to_row(item))
+            if len(rows) == 1:
+                await db.execute(self._insert_query, rows[0])
+            else:
+                await db.executemany(self._insert_query, rows)
             await db.commit()
 
     async def _read(self, since: float = 0) -> Any:
         """Read items since the given timestamp."""
+        from_row = self._from_row
         async with self.async_connection() as db:
             async with db.execute(self._select_query, (since,)) as cursor:
                 async for row in cursor:
-                    yield self._from_row(row)
+                    yield from_row(row)
 
     async def _count(self) -> int:
         """Return total number of items in storage."""
         async with self.async_connection() as db:
-            async with db.execute(self._count_query) as cursor:
-                row = await cursor.fetchone()
-                return row[0] if row else 0
+            return await _fetch_count(db, self._count_query)
 
     async def _delete_before(self, timestamp: float) -> int:
-        """Delete items with timestamp < given value."""
+        """Delete items with timestamp < given value.
+
+        Deletes in batches of _DELETE_BATCH_SIZE rows, one transaction each.
+        """
+        deleted = 0
         async with self.async_connection() as db:
-            cursor = await db.execute(self._delete_before_query, (timestamp,))
-            deleted = cursor.rowcount
-            await db.commit()
-            return deleted
+            while True:
+                cursor = await db.execute(
+                    self._delete_before_query, (timestamp, _DELETE_BATCH_SIZE)
+                )
+                await db.commit()
+                deleted += cursor.rowcount
+                if cursor.rowcount < _DELETE_BATCH_SIZE:
+                    return deleted
 
     async def _clear(self) -> None:
         """Clear all items from storage."""
@@ -295,7 +536,7 @@ class SQLiteStorageGeneric(SQLiteStorageBase):
         """Synchronous read for non-async contexts."""
         with self.sync_connection() as conn:
             cursor = conn.execute(self._select_query, (since,))
-            return [self._from_row(row) for row in cursor]
+            return list(map(self._from_row, cursor))
 
     def _clear_sync(self) -> None:
         """Synchronous clear for non-async contexts."""
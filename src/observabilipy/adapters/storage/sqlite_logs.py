@@ -1,21 +1,22 @@
 """SQLite storage adapter for logs."""
 
-import json
 import sqlite3
-from collections.abc import AsyncIterable
+from collections.abc import AsyncIterable, Iterable
 from typing import Any
 
 import aiosqlite
 
 from observabilipy.adapters.storage.sqlite_base import (
     SQLiteStorageGeneric,
+    _fetch_count,
+    _json_dumps,
     _safe_json_loads,
 )
 from observabilipy.core.models import LogEntry
 
 _LOGS_SCHEMA = """
 CREATE TABLE IF NOT EXISTS logs (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    id INTEGER PRIMARY KEY,
     timestamp REAL NOT NULL,
     level TEXT NOT NULL,
     message TEXT NOT NULL,
@@ -23,6 +24,8 @@ CREATE TABLE IF NOT EXISTS logs (
 );
 CREATE INDEX IF NOT EXISTS idx_logs_timestamp ON logs(timestamp);
 CREATE INDEX IF NOT EXISTS idx_logs_level_timestamp ON logs(level, timestamp);
+CREATE INDEX IF NOT EXISTS idx_logs_upper_level_timestamp
+    ON logs(UPPER(level), timestamp);
 """
 
 _INSERT_LOG = """
@@ -36,6 +39,8 @@ WHERE timestamp > ?
 ORDER BY timestamp ASC
 """
 
+# Served by the UPPER(level) expression index, so the case-insensitive match
+# is an index range scan rather than a scan of every row since the timestamp
 _SELECT_LOGS_BY_LEVEL = """
 SELECT timestamp, level, message, attributes
 FROM logs
@@ -48,7 +53,9 @@ SELECT COUNT(*) FROM logs
 """
 
 _DELETE_LOGS_BEFORE = """
-DELETE FROM logs WHERE timestamp < ?
+DELETE FROM logs WHERE id IN (
+    SELECT id FROM logs WHERE timestamp < ? LIMIT ?
+)
 """
 
 _DELETE_LOGS_BY_LEVEL_BEFORE = """
@@ -73,7 +80,8 @@ class SQLiteLogStorage(SQLiteStorageGeneric):
     Sync methods (write_sync, read_sync, clear_sync) use the standard
     sqlite3 module for non-async contexts like WSGI or testing.
     For file-based databases, sync and async methods share the same file.
-    For :memory: databases, sync and async have separate in-memory DBs.
+    For :memory: databases, sync and async have separate in-memory DBs
+    unless shared_memory=True is passed.
     """
 
     _table_name = "logs"
@@ -83,8 +91,8 @@ class SQLiteLogStorage(SQLiteStorageGeneric):
     _delete_before_query = _DELETE_LOGS_BEFORE
     _clear_query = "DELETE FROM logs"
 
-    def __init__(self, db_path: str) -> None:
-        super().__init__(db_path, _LOGS_SCHEMA)
+    def __init__(self, db_path: str, shared_memory: bool = False) -> None:
+        super().__init__(db_path, _LOGS_SCHEMA, shared_memory)
 
     def _to_row(self, item: LogEntry) -> tuple[Any, ...]:
         """Convert LogEntry to database row."""
@@ -92,7 +100,7 @@ class SQLiteLogStorage(SQLiteStorageGeneric):
             item.timestamp,
             item.level,
             item.message,
-            json.dumps(item.attributes),
+            _json_dumps(item.attributes),
         )
 
     def _from_row(self, row: sqlite3.Row | aiosqlite.Row) -> LogEntry:
@@ -109,6 +117,10 @@ class SQLiteLogStorage(SQLiteStorageGeneric):
         """Write a log entry to storage."""
         await self._write(entry)
 
+    async def write_many(self, entries: Iterable[LogEntry]) -> None:
+        """Write a batch of log entries in a single transaction."""
+        await self._write_many(entries)
+
     # @tra: Adapter.SQLiteStorage.LevelFiltering
     async def read(
         self, since: float = 0, level: str | None = None
@@ -120,11 +132,12 @@ class SQLiteLogStorage(SQLiteStorageGeneric):
         """
         if level is not None:
             # Use level-specific query
+            from_row = self._from_row
             async with self.async_connection() as db:
                 params: tuple[float, str] = (since, level)
                 async with db.execute(_SELECT_LOGS_BY_LEVEL, params) as cursor:
                     async for row in cursor:
-                        yield self._from_row(row)
+                        yield from_row(row)
         else:
             # Use base class implementation
             async for entry in self._read(since):
@@ -151,9 +164,7 @@ class SQLiteLogStorage(SQLiteStorageGeneric):
     async def count_by_level(self, level: str) -> int:
         """Return number of log entries with the specified level."""
         async with self.async_connection() as db:
-            async with db.execute(_COUNT_LOGS_BY_LEVEL, (level,)) as cursor:
-                row = await cursor.fetchone()
-                return row[0] if row else 0
+            return await _fetch_count(db, _COUNT_LOGS_BY_LEVEL, (level,))
 
     # --- Sync methods using standard sqlite3 module ---
 
@@ -168,6 +179,6 @@ class SQLiteLogStorage(SQLiteStorageGeneric):
             with self.sync_connection() as conn:
                 params: tuple[float, str] = (since, level)
                 cursor = conn.execute(_SELECT_LOGS_BY_LEVEL, params)
-                return [self._from_row(row) for row in cursor]
+                return list(map(self._from_row, cursor))
         else:
             return self._read_sync(since)
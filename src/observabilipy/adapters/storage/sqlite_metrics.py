@@ -1,33 +1,36 @@
 """SQLite storage adapter for metrics."""
 
-import json
 import sqlite3
-from collections.abc import AsyncIterable
+from collections.abc import AsyncIterable, Iterable
 from typing import Any
 
 import aiosqlite
 
 from observabilipy.adapters.storage.sqlite_base import (
     SQLiteStorageGeneric,
+    _json_dumps,
     _safe_json_loads,
 )
 from observabilipy.core.models import MetricSample
 
 _METRICS_SCHEMA = """
 CREATE TABLE IF NOT EXISTS metrics (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    id INTEGER PRIMARY KEY,
     name TEXT NOT NULL,
     timestamp REAL NOT NULL,
     value REAL NOT NULL,
     labels TEXT NOT NULL DEFAULT '{}'
 );
-CREATE INDEX IF NOT EXISTS idx_metrics_timestamp ON metrics(timestamp);
+DROP INDEX IF EXISTS idx_metrics_timestamp;
+CREATE INDEX IF NOT EXISTS idx_metrics_timestamp_covering
+    ON metrics(timestamp, name, value, labels);
 """
 
 _INSERT_METRIC = """
 INSERT INTO metrics (name, timestamp, value, labels) VALUES (?, ?, ?, ?)
 """
 
+# Answered from the covering index alone: no table lookup per returned row
 _SELECT_METRICS_SINCE = """
 SELECT name, timestamp, value, labels FROM metrics
 WHERE timestamp > ?
@@ -39,7 +42,9 @@ SELECT COUNT(*) FROM metrics
 """
 
 _DELETE_METRICS_BEFORE = """
-DELETE FROM metrics WHERE timestamp < ?
+DELETE FROM metrics WHERE id IN (
+    SELECT id FROM metrics WHERE timestamp < ? LIMIT ?
+)
 """
 
 
@@ -57,7 +62,8 @@ class SQLiteMetricsStorage(SQLiteStorageGeneric):
     Sync methods (write_sync, read_sync, clear_sync) use the standard
     sqlite3 module for non-async contexts like WSGI or testing.
     For file-based databases, sync and async methods share the same file.
-    For :memory: databases, sync and async have separate in-memory DBs.
+    For :memory: databases, sync and async have separate in-memory DBs
+    unless shared_memory=True is passed.
     """
 
     _table_name = "metrics"
@@ -67,8 +73,8 @@ class SQLiteMetricsStorage(SQLiteStorageGeneric):
     _delete_before_query = _DELETE_METRICS_BEFORE
     _clear_query = "DELETE FROM metrics"
 
-    def __init__(self, db_path: str) -> None:
-        super().__init__(db_path, _METRICS_SCHEMA)
+    def __init__(self, db_path: str, shared_memory: bool = False) -> None:
+        super().__init__(db_path, _METRICS_SCHEMA, shared_memory)
 
     def _to_row(self, item: MetricSample) -> tuple[Any, ...]:
         """Convert MetricSample to database row."""
@@ -76,7 +82,7 @@ class SQLiteMetricsStorage(SQLiteStorageGeneric):
             item.name,
             item.timestamp,
             item.value,
-            json.dumps(item.labels),
+            _json_dumps(item.labels),
         )
 
     def _from_row(self, row: sqlite3.Row | aiosqlite.Row) -> MetricSample:
@@ -92,6 +98,10 @@ class SQLiteMetricsStorage(SQLiteStorageGeneric):
         """Write a metric sample to storage."""
         await self._write(sample)
 
+    async def write_many(self, samples: Iterable[MetricSample]) -> None:
+        """Write a batch of metric samples in a single transaction."""
+        await self._write_many(samples)
+
     async def read(self, since: float = 0) -> AsyncIterable[MetricSample]:
         """Read metric samples since the given timestamp.
 
@@ -1,7 +1,7 @@
 """NDJSON encoder for log entries and metric samples."""
 
 import json
-from collections.abc import AsyncIterable, Iterable
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
 
 from observabilipy.core.models import LogEntry, MetricSample
 
@@ -79,6 +79,40 @@ async def encode_logs(entries: AsyncIterable[LogEntry]) -> str:
     return "\n".join(lines) + "\n"
 
 
+async def encode_logs_iter(entries: AsyncIterable[LogEntry]) -> AsyncIterator[bytes]:
+    """Encode log entries to NDJSON, yielding one encoded line at a time.
+
+    Streaming counterpart of encode_logs() for adapters that can send the
+    response body in chunks, keeping peak memory independent of the number
+    of entries.
+
+    Args:
+        entries: An async iterable of LogEntry objects.
+
+    Yields:
+        One UTF-8 encoded JSON line (including the trailing newline) per entry.
+
+    Example:
+        >>> import asyncio
+        >>> from observabilipy import LogEntry
+        >>> from observabilipy.core.encoding.ndjson import encode_logs_iter
+        >>> async def make_entries():
+        ...     yield LogEntry(timestamp=1.0, level="INFO", message="Hi")
+        >>> async def collect():
+        ...     return [line async for line in encode_logs_iter(make_entries())]
+        >>> asyncio.run(collect())
+        [b'{"timestamp": 1.0, "level": "INFO", "message": "Hi", "attributes": {}}\\n']
+    """
+    async for entry in entries:
+        obj = {
+            "timestamp": entry.timestamp,
+            "level": entry.level,
+            "message": entry.message,
+            "attributes": entry.attributes,
+        }
+        yield (json.dumps(obj) + "\n").encode()
+
+
 def encode_ndjson_sync(samples: Iterable[MetricSample]) -> str:
     """Encode metric samples to newline-delimited JSON (synchronous version).
 
@@ -146,3 +180,40 @@ async def encode_ndjson(samples: AsyncIterable[MetricSample]) -> str:
         return ""
 
     return "\n".join(lines) + "\n"
+
+
+async def encode_ndjson_iter(
+    samples: AsyncIterable[MetricSample],
+) -> AsyncIterator[bytes]:
+    """Encode metric samples to NDJSON, yielding one encoded line at a time.
+
+    Streaming counterpart of encode_ndjson() for adapters that can send the
+    response body in chunks, keeping peak memory independent of the number
+    of samples.
+
+    Args:
+        samples: An async iterable of MetricSample objects.
+
+    Yields:
+        One UTF-8 encoded JSON line (including the trailing newline) per sample.
+
+    Example:
+        >>> import asyncio
+        >>> from observabilipy import MetricSample
+        >>> from observabilipy.core.encoding.ndjson import encode_ndjson_iter
+        >>> async def make_samples():
+        ...     yield MetricSample(name="cpu", timestamp=1.0, value=50.0)
+        >>> async def collect():
+        ...     return [line async for line in encode_ndjson_iter(make_samples())]
+        >>> lines = asyncio.run(collect())
+        >>> len(lines), lines[0].endswith(b"\\n")
+        (1, True)
+    """
+    async for sample in samples:
+        obj = {
+            "name": sample.name,
+            "timestamp": sample.timestamp,
+            "value": sample.value,
+            "labels": sample.labels,
+        }
+        yield (json.dumps(obj) + "\n").encode()
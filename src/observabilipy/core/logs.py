@@ -89,9 +89,10 @@ def timed_log(
         True
     """
     result = TimedLogResult()
+    start_timestamp = time.time()
     start = time.perf_counter()
     entry_log = LogEntry(
-        timestamp=time.time(),
+        timestamp=start_timestamp,
         level=level,
         message=f"{message} [entry]",
         attributes={"phase": "entry", **attributes},
@@ -100,7 +101,9 @@ def timed_log(
     yield result
     elapsed = time.perf_counter() - start
     exit_log = LogEntry(
-        timestamp=time.time(),
+        # Derived from the monotonic clock, so the exit timestamp is exactly
+        # elapsed_seconds after the entry one and needs no second clock read
+        timestamp=start_timestamp + elapsed,
         level=level,
         message=f"{message} [exit]",
         attributes={"phase": "exit", "elapsed_seconds": elapsed, **attributes},
@@ -99,27 +99,24 @@ def histogram(
     timestamp = time.time()
     base_labels = labels or {}
     bucket_boundaries = buckets if buckets is not None else DEFAULT_HISTOGRAM_BUCKETS
-
-    samples: list[MetricSample] = []
+    bucket_name = f"{name}_bucket"
 
     # Create bucket samples with cumulative counts
-    for boundary in bucket_boundaries:
-        bucket_labels = {**base_labels, "le": str(boundary)}
-        bucket_value = 1.0 if value <= boundary else 0.0
-        samples.append(
-            MetricSample(
-                name=f"{name}_bucket",
-                timestamp=timestamp,
-                value=bucket_value,
-                labels=bucket_labels,
-            )
+    samples = [
+        MetricSample(
+            name=bucket_name,
+            timestamp=timestamp,
+            value=1.0 if value <= boundary else 0.0,
+            labels={**base_labels, "le": str(boundary)},
         )
+        for boundary in bucket_boundaries
+    ]
 
     # Always add +Inf bucket (always contains the observation)
     inf_labels = {**base_labels, "le": "+Inf"}
     samples.append(
         MetricSample(
-            name=f"{name}_bucket",
+            name=bucket_name,
             timestamp=timestamp,
             value=1.0,
             labels=inf_labels,
@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from observabilipy.core.exceptions import ConfigurationError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LogEntry:
     """A structured log entry.
 
@@ -34,7 +34,7 @@ class LogEntry:
     attributes: dict[str, str | int | float | bool] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MetricSample:
     """A single metric measurement.
 
@@ -4,12 +4,50 @@ Services wrap storage ports to add domain logic like filtering,
 keeping adapters thin and focusing domain rules in the core layer.
 """
 
-from collections.abc import AsyncIterable
+from collections.abc import AsyncIterable, Iterable
+from typing import Protocol
 
 from observabilipy.core.models import LogEntry
 from observabilipy.core.ports import LogStoragePort
 
 
+class _SupportsWrite[T](Protocol):
+    """Any storage port: LogStoragePort, MetricsStoragePort or a wrapper."""
+
+    async def write(self, item: T, /) -> None: ...
+
+
+async def _write_all[T](storage: _SupportsWrite[T], items: Iterable[T]) -> None:
+    """Store items with the storage's write_many(), falling back to write().
+
+    write_many() is an optional batch method: the bundled storages provide
+    it, but a storage that only implements the port's write() still works.
+
+    Args:
+        storage: Log or metrics storage to write to.
+        items: Entries or samples to store, in order.
+
+    Example:
+        >>> import asyncio
+        >>> from observabilipy import LogEntry
+        >>> class WriteOnlyStorage:
+        ...     def __init__(self):
+        ...         self.entries = []
+        ...     async def write(self, entry):
+        ...         self.entries.append(entry)
+        >>> storage = WriteOnlyStorage()
+        >>> entries = [LogEntry(timestamp=1.0, level="INFO", message="a")]
+        >>> asyncio.run(_write_all(storage, entries))
+        >>> len(storage.entries)
+        1
+    """
+    if hasattr(storage, "write_many"):
+        await storage.write_many(items)
+        return
+    for item in items:
+        await storage.write(item)
+
+
 # @tra: Core.LogStorageWithLevelFilter.DomainFiltering
 class LogStorageWithLevelFilter:
     """Domain service wrapper adding level-based filtering to any LogStoragePort.
@@ -122,6 +160,10 @@ class LogStorageWithLevelFilter:
         """Synchronous write for non-async contexts (testing, WSGI)."""
         self._storage.write_sync(entry)
 
+    async def write_many(self, entries: Iterable[LogEntry]) -> None:
+        """Write a batch of log entries to storage."""
+        await _write_all(self._storage, entries)
+
     async def read(
         self, since: float = 0, level: str | None = None
     ) -> AsyncIterable[LogEntry]:
@@ -1,5 +1,6 @@
 """Runtime components for observability."""
 
 from observabilipy.runtime.embedded import EmbeddedRuntime
+from observabilipy.runtime.event_loop import fast_loop_factory
 
-__all__ = ["EmbeddedRuntime"]
+__all__ = ["EmbeddedRuntime", "fast_loop_factory"]
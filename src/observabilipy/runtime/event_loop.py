@@ -0,0 +1,31 @@
+"""Event loop selection for serving the observability endpoints."""
+
+import asyncio
+from collections.abc import Callable
+
+
+def fast_loop_factory() -> Callable[[], asyncio.AbstractEventLoop]:
+    """Return a factory for uvloop event loops, or asyncio's if not installed.
+
+    The ASGI endpoints spend most of their time in ``send`` and storage
+    awaits, so a faster loop speeds them up without any code changes. Pass
+    the result as ``loop_factory`` to ``asyncio.run`` or ``asyncio.Runner``.
+    Install uvloop with the ``uvloop`` extra; without it the default asyncio
+    loop is used. Servers that create their own loop select it themselves,
+    e.g. ``uvicorn --loop uvloop``.
+
+    Returns:
+        ``uvloop.new_event_loop`` if uvloop is installed, otherwise
+        ``asyncio.new_event_loop``.
+
+    Example:
+        from observabilipy.runtime import fast_loop_factory
+
+        asyncio.run(serve(), loop_factory=fast_loop_factory())
+    """
+    try:
+        import uvloop  # type: ignore[import-not-found,unused-ignore]
+    except ImportError:
+        return asyncio.new_event_loop
+    factory: Callable[[], asyncio.AbstractEventLoop] = uvloop.new_event_loop
+    return factory
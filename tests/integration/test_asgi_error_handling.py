@@ -3,6 +3,7 @@
 from collections.abc import Callable
 from contextlib import asynccontextmanager
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
@@ -18,14 +19,15 @@ async def mock_encoder(encoder_name: str, failing_encoder: Callable[..., Any]):
     """Context manager for temporarily replacing an encoder with a failing one.
 
     Args:
-        encoder_name: Name of the encoder function to mock (e.g., 'encode_ndjson')
-        failing_encoder: Callable that raises an exception
+        encoder_name: Name of the encoder function to mock
+            (e.g., 'encode_ndjson_iter')
+        failing_encoder: Async generator function that raises an exception
 
     Yields:
         None
 
     Example:
-        async with mock_encoder('encode_ndjson', failing_encode):
+        async with mock_encoder('encode_ndjson_iter', failing_encode):
             response = await client.get("/metrics")
     """
     import observabilipy.adapters.frameworks.asgi as asgi_module
@@ -56,8 +58,9 @@ class TestASGIErrorHandling:
 
         async def failing_encode(*_args, **_kwargs):
             raise ValueError("Encoding failed")
+            yield b""  # Makes this an async generator
 
-        async with mock_encoder("encode_ndjson", failing_encode):
+        async with mock_encoder("encode_ndjson_iter", failing_encode):
             async with asgi_test_client(app) as client:
                 response = await client.get("/metrics")
 
@@ -78,8 +81,9 @@ class TestASGIErrorHandling:
 
         async def failing_encode(*_args, **_kwargs):
             raise ValueError("Encoding failed")
+            yield b""  # Makes this an async generator
 
-        async with mock_encoder("encode_logs", failing_encode):
+        async with mock_encoder("encode_logs_iter", failing_encode):
             async with asgi_test_client(app) as client:
                 response = await client.get("/logs")
 
@@ -100,8 +104,9 @@ class TestASGIErrorHandling:
 
         async def failing_encode(*_args, **_kwargs):
             raise ValueError("Sensitive database connection error: db://prod")
+            yield b""  # Makes this an async generator
 
-        async with mock_encoder("encode_ndjson", failing_encode):
+        async with mock_encoder("encode_ndjson_iter", failing_encode):
             async with asgi_test_client(app) as client:
                 response = await client.get("/metrics")
 
@@ -126,8 +131,9 @@ class TestASGIErrorHandling:
 
         async def failing_encode(*_args, **_kwargs):
             raise ValueError("Sensitive API key: secret_xyz789")
+            yield b""  # Makes this an async generator
 
-        async with mock_encoder("encode_logs", failing_encode):
+        async with mock_encoder("encode_logs_iter", failing_encode):
             async with asgi_test_client(app) as client:
                 response = await client.get("/logs")
 
@@ -159,6 +165,46 @@ class TestASGIRouting:
 
         assert response.status_code == 404
 
+    @pytest.mark.tier(2)
+    @pytest.mark.tra("Adapter.ASGI.RoutingMethodNotAllowed")
+    @pytest.mark.asgi
+    async def test_unsupported_method_returns_405(
+        self,
+        log_storage: InMemoryLogStorage,
+        metrics_storage: InMemoryMetricsStorage,
+        asgi_test_client,
+    ) -> None:
+        """Test that non-GET/HEAD methods return 405 with an Allow header."""
+        app = create_asgi_app(log_storage, metrics_storage)
+
+        async with asgi_test_client(app) as client:
+            response = await client.post("/logs")
+
+        assert response.status_code == 405
+        assert response.headers["allow"] == "GET, HEAD"
+
+    @pytest.mark.tier(2)
+    @pytest.mark.tra("Adapter.ASGI.RoutingHead")
+    @pytest.mark.asgi
+    async def test_head_returns_headers_without_reading_storage(
+        self,
+        log_storage: InMemoryLogStorage,
+        metrics_storage: InMemoryMetricsStorage,
+        asgi_test_client,
+    ) -> None:
+        """Test that HEAD answers with the endpoint headers and no body."""
+        app = create_asgi_app(log_storage, metrics_storage)
+
+        with patch.object(
+            metrics_storage, "read", side_effect=AssertionError("storage read")
+        ):
+            async with asgi_test_client(app) as client:
+                response = await client.head("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.content == b""
+
 
 class TestASGIJSONErrorResponses:
     """Tests for JSON-formatted error responses."""
@@ -177,8 +223,9 @@ class TestASGIJSONErrorResponses:
 
         async def failing_encode(*_args, **_kwargs):
             raise ValueError("Encoding failed")
+            yield b""  # Makes this an async generator
 
-        async with mock_encoder("encode_ndjson", failing_encode):
+        async with mock_encoder("encode_ndjson_iter", failing_encode):
             async with asgi_test_client(app) as client:
                 response = await client.get("/metrics")
 
@@ -201,8 +248,9 @@ class TestASGIJSONErrorResponses:
 
         async def failing_encode(*_args, **_kwargs):
             raise ValueError("Encoding failed")
+            yield b""  # Makes this an async generator
 
-        async with mock_encoder("encode_logs", failing_encode):
+        async with mock_encoder("encode_logs_iter", failing_encode):
             async with asgi_test_client(app) as client:
                 response = await client.get("/logs")
 
@@ -1,7 +1,8 @@
 """Integration tests for ASGI /metrics endpoints."""
 
+import asyncio
 import json
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterable
 
 import pytest
 
@@ -10,6 +11,7 @@ from observabilipy.adapters.storage.in_memory import (
     InMemoryLogStorage,
     InMemoryMetricsStorage,
 )
+from observabilipy.core.exceptions import ConfigurationError
 from observabilipy.core.models import MetricSample
 
 
@@ -250,3 +252,106 @@ class TestASGIMetricsPrometheusEndpoint:
 
         assert response.status_code == 200
         assert response.text == ""
+
+
+class TestASGIPrometheusCache:
+    """Tests for the optional /metrics/prometheus response cache."""
+
+    @pytest.mark.tier(2)
+    @pytest.mark.tra("Adapter.ASGI.PrometheusEndpointCache")
+    @pytest.mark.asgi
+    async def test_cached_body_reused_within_ttl(
+        self,
+        log_storage: InMemoryLogStorage,
+        metrics_storage: InMemoryMetricsStorage,
+        asgi_test_client,
+    ) -> None:
+        """Test that a scrape within the TTL returns the previously encoded body."""
+        await metrics_storage.write(
+            MetricSample(name="counter", timestamp=100.0, value=1.0, labels={})
+        )
+        app = create_asgi_app(log_storage, metrics_storage, prometheus_cache_ttl=60.0)
+
+        async with asgi_test_client(app) as client:
+            first = await client.get("/metrics/prometheus")
+            await metrics_storage.write(
+                MetricSample(name="counter", timestamp=200.0, value=5.0, labels={})
+            )
+            second = await client.get("/metrics/prometheus")
+
+        assert second.status_code == 200
+        assert second.text == first.text
+        assert "1.0" in second.text
+
+    @pytest.mark.tier(2)
+    @pytest.mark.tra("Adapter.ASGI.PrometheusEndpointCache")
+    @pytest.mark.asgi
+    async def test_no_cache_by_default(
+        self,
+        log_storage: InMemoryLogStorage,
+        metrics_storage: InMemoryMetricsStorage,
+        asgi_test_client,
+    ) -> None:
+        """Test that every scrape is re-encoded when no TTL is configured."""
+        await metrics_storage.write(
+            MetricSample(name="counter", timestamp=100.0, value=1.0, labels={})
+        )
+        app = create_asgi_app(log_storage, metrics_storage)
+
+        async with asgi_test_client(app) as client:
+            await client.get("/metrics/prometheus")
+            await metrics_storage.write(
+                MetricSample(name="counter", timestamp=200.0, value=5.0, labels={})
+            )
+            response = await client.get("/metrics/prometheus")
+
+        assert "5.0" in response.text
+
+    @pytest.mark.tier(2)
+    @pytest.mark.tra("Adapter.ASGI.PrometheusEndpointSingleFlight")
+    @pytest.mark.asgi
+    async def test_concurrent_scrapes_share_one_encode(
+        self,
+        log_storage: InMemoryLogStorage,
+        metrics_storage: InMemoryMetricsStorage,
+        asgi_test_client,
+    ) -> None:
+        """Test that overlapping scrapes join the encode already in flight."""
+        await metrics_storage.write(
+            MetricSample(name="counter", timestamp=100.0, value=1.0, labels={})
+        )
+        reads = 0
+        original_read = metrics_storage.read
+
+        async def slow_read(since: float = 0) -> AsyncIterable[MetricSample]:
+            nonlocal reads
+            reads += 1
+            await asyncio.sleep(0.05)
+            async for sample in original_read(since):
+                yield sample
+
+        metrics_storage.read = slow_read  # type: ignore[method-assign]
+        app = create_asgi_app(log_storage, metrics_storage)
+
+        async with asgi_test_client(app) as client:
+            responses = await asyncio.gather(
+                *(client.get("/metrics/prometheus") for _ in range(3))
+            )
+            later = await client.get("/metrics/prometheus")
+
+        assert all(r.text == responses[0].text for r in responses)
+        assert "counter 1.0" in responses[0].text
+        assert later.status_code == 200
+        assert reads == 2
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Adapter.ASGI.PrometheusEndpointCache")
+    @pytest.mark.asgi
+    def test_negative_ttl_raises(
+        self,
+        log_storage: InMemoryLogStorage,
+        metrics_storage: InMemoryMetricsStorage,
+    ) -> None:
+        """Test that a negative cache TTL is rejected."""
+        with pytest.raises(ConfigurationError, match="prometheus_cache_ttl"):
+            create_asgi_app(log_storage, metrics_storage, prometheus_cache_ttl=-1.0)
@@ -110,3 +110,29 @@ async def test_middleware_counter_name_is_http_requests_total(
     metrics = [m async for m in metrics_storage.read()]
     counters = [m for m in metrics if m.name == "http_requests_total"]
     assert len(counters) == 1
+
+
+class _WriteOnlyMetricsStorage(InMemoryMetricsStorage):
+    """Metrics storage without the optional write_many() batch method."""
+
+    def __getattribute__(self, name: str) -> object:
+        if name == "write_many":
+            raise AttributeError(name)
+        return super().__getattribute__(name)
+
+
+@pytest.mark.asyncio
+async def test_middleware_records_metrics_without_write_many(
+    basic_asgi_app, asgi_scope, asgi_send_capture, log_storage
+):
+    """Storages that only implement write() still receive request metrics."""
+    metrics_storage = _WriteOnlyMetricsStorage()
+    middleware = ASGIObservabilityMiddleware(
+        basic_asgi_app, log_storage=log_storage, metrics_storage=metrics_storage
+    )
+
+    send, _responses = asgi_send_capture
+
+    await middleware(asgi_scope(method="GET", path="/test"), lambda: None, send)
+    names = [m.name async for m in metrics_storage.read()]
+    assert sorted(names) == ["http_request_duration_seconds", "http_requests_total"]
@@ -48,7 +48,7 @@ async def _send(message):
 # @tra: Adapter.ASGI.Middleware.ExcludePaths.DefaultEmpty
 @pytest.mark.asyncio
 async def test_middleware_exclude_paths_default_empty():
-    """Test that exclude_paths defaults to empty list when not provided."""
+    """Test that exclude_paths defaults to empty when not provided."""
     log_storage = InMemoryLogStorage()
     metrics_storage = InMemoryMetricsStorage()
 
@@ -58,7 +58,7 @@ async def test_middleware_exclude_paths_default_empty():
         metrics_storage=metrics_storage,
     )
 
-    assert middleware.exclude_paths == []
+    assert middleware.exclude_paths == ()
 
 
 # @tra: Adapter.ASGI.Middleware.ExcludePaths.ExactMatch
@@ -151,3 +151,79 @@ async def test_middleware_logs_non_excluded_paths():
     histogram = [m for m in metrics if m.name == "http_request_duration_seconds"]
     assert len(counter) == 1, "Expected 1 counter metric"
     assert len(histogram) == 1, "Expected 1 histogram metric"
+
+
+# @tra: Adapter.ASGI.Middleware.Passthrough
+@pytest.mark.asyncio
+async def test_middleware_passes_server_send_through_for_excluded_paths():
+    """Test that excluded paths reach the app with the unwrapped send callable."""
+    received_sends = []
+
+    async def recording_app(scope, receive, send):
+        received_sends.append(send)
+        await _basic_app(scope, receive, send)
+
+    middleware = ASGIObservabilityMiddleware(
+        app=recording_app,
+        log_storage=InMemoryLogStorage(),
+        metrics_storage=InMemoryMetricsStorage(),
+        exclude_paths=["/health"],
+    )
+
+    await middleware(await _make_scope("/health"), _receive, _send)
+    await middleware(await _make_scope("/api"), _receive, _send)
+
+    assert received_sends[0] is _send
+    assert received_sends[1] is not _send
+
+
+# @tra: Adapter.ASGI.Middleware.ExcludePaths.WildcardMatch
+@pytest.mark.parametrize(
+    ("path", "excluded"),
+    [
+        ("/health", True),
+        ("/healthz", False),
+        ("/internal/metrics/raw", True),
+        ("/internal", False),
+        ("/api/v2/debug", True),
+        ("/api/v10/debug", False),
+    ],
+)
+def test_exclude_paths_match_like_fnmatch(path: str, excluded: bool) -> None:
+    """Test that exact, prefix, and glob patterns keep fnmatch semantics."""
+    middleware = ASGIObservabilityMiddleware(
+        app=_basic_app,
+        log_storage=None,
+        metrics_storage=None,
+        exclude_paths=["/health", "/internal/*", "/api/v?/debug"],
+    )
+
+    assert middleware._path_excluded(path) is excluded
+
+
+def test_exclude_paths_reassignment_recompiles() -> None:
+    """Test that assigning exclude_paths after construction takes effect."""
+    middleware = ASGIObservabilityMiddleware(
+        app=_basic_app, log_storage=None, metrics_storage=None
+    )
+
+    middleware.exclude_paths = ["/ready"]
+
+    assert middleware.exclude_paths == ("/ready",)
+    assert middleware._path_excluded("/ready")
+
+
+def test_exclude_paths_getter_is_read_only() -> None:
+    """Test that the getter cannot be mutated to bypass the compiled matchers."""
+    middleware = ASGIObservabilityMiddleware(
+        app=_basic_app,
+        log_storage=None,
+        metrics_storage=None,
+        exclude_paths=["/health"],
+    )
+
+    with pytest.raises(AttributeError):
+        middleware.exclude_paths.append("/ready")  # type: ignore[attr-defined]
+
+    assert middleware.exclude_paths == ("/health",)
+    assert not middleware._path_excluded("/ready")
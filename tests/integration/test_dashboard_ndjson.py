@@ -139,3 +139,17 @@ class TestDashboardNDJSONIntegration:
         # Should have NDJSON parsing (split on newlines, parse each line)
         assert "split" in html  # For splitting NDJSON lines
         assert "JSON.parse" in html  # For parsing each line
+
+    @pytest.mark.fastapi
+    def test_dashboard_html_revalidates_with_etag(self) -> None:
+        """Dashboard HTML is served with an ETag and 304s on a matching request."""
+        client = TestClient(dashboard_example.app)
+        first = client.get("/")
+        etag = first.headers["etag"]
+
+        second = client.get("/", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert "max-age" in first.headers["cache-control"]
+        assert second.status_code == 304
+        assert second.content == b""
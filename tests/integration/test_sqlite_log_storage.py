@@ -1,8 +1,12 @@
 """Tests for SQLite log storage adapter."""
 
+import asyncio
+from typing import Any
+
 import pytest
 
-from observabilipy.adapters.storage import SQLiteLogStorage
+from observabilipy.adapters.storage import SQLiteLogStorage, sqlite_base
+from observabilipy.adapters.storage.sqlite_logs import _SELECT_LOGS_BY_LEVEL
 from observabilipy.core.models import LogEntry
 from observabilipy.core.ports import LogStoragePort
 
@@ -46,6 +50,131 @@ class TestSQLiteLogStorage:
             await memory_log_storage.write(entry)
         assert await memory_log_storage.count() == 3
 
+    @pytest.mark.tra("Adapter.SQLiteStorage.ImplementsLogStoragePort")
+    @pytest.mark.storage
+    async def test_write_many_writes_all_entries(
+        self, memory_log_storage: SQLiteLogStorage
+    ) -> None:
+        """write_many() persists a whole batch in one transaction."""
+        entries = [
+            LogEntry(
+                timestamp=1000.0 + i,
+                level="INFO",
+                message=f"msg{i}",
+                attributes={"i": i},
+            )
+            for i in range(5)
+        ]
+
+        await memory_log_storage.write_many(entries)
+        result = [e async for e in memory_log_storage.read()]
+
+        assert result == entries
+
+    @pytest.mark.tra("Adapter.SQLiteStorage.ImplementsLogStoragePort")
+    @pytest.mark.storage
+    async def test_write_many_empty_batch_is_noop(
+        self, memory_log_storage: SQLiteLogStorage
+    ) -> None:
+        """write_many() with an empty batch writes nothing."""
+        await memory_log_storage.write_many([])
+
+        assert await memory_log_storage.count() == 0
+
+    @pytest.mark.tra("Adapter.SQLiteStorage.ImplementsLogStoragePort")
+    @pytest.mark.storage
+    async def test_concurrent_writes_share_one_transaction(
+        self, memory_log_storage: SQLiteLogStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Concurrent write() calls are committed together in one batch."""
+        batches: list[int] = []
+        insert_rows = memory_log_storage._insert_rows
+
+        async def spy(rows: list[tuple[Any, ...]]) -> None:
+            batches.append(len(rows))
+            await insert_rows(rows)
+
+        monkeypatch.setattr(memory_log_storage, "_insert_rows", spy)
+        entries = [
+            LogEntry(timestamp=1000.0 + i, level="INFO", message=f"m{i}", attributes={})
+            for i in range(20)
+        ]
+
+        await asyncio.gather(*(memory_log_storage.write(e) for e in entries))
+        result = [e async for e in memory_log_storage.read()]
+
+        assert batches == [20]
+        assert result == entries
+
+    @pytest.mark.tra("Adapter.SQLiteStorage.ImplementsLogStoragePort")
+    @pytest.mark.storage
+    async def test_failed_coalesced_write_raises_in_every_writer(
+        self, memory_log_storage: SQLiteLogStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Every writer in a coalesced batch sees the transaction's error."""
+
+        async def failing(rows: list[tuple[Any, ...]]) -> None:
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr(memory_log_storage, "_insert_rows", failing)
+        entry = LogEntry(timestamp=1000.0, level="INFO", message="m", attributes={})
+
+        results = await asyncio.gather(
+            *(memory_log_storage.write(entry) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert (
+            memory_log_storage._pending_writes.get(asyncio.get_running_loop()) is None
+        )
+
+    @pytest.mark.tra("Adapter.SQLiteStorage.ImplementsLogStoragePort")
+    @pytest.mark.storage
+    async def test_cancelled_first_writer_does_not_drop_joined_rows(
+        self, memory_log_storage: SQLiteLogStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Cancelling the writer that started a batch still commits the batch."""
+        flushing = asyncio.Event()
+        release = asyncio.Event()
+        insert_rows = memory_log_storage._insert_rows
+
+        async def gated(rows: list[tuple[Any, ...]]) -> None:
+            flushing.set()
+            await release.wait()
+            await insert_rows(rows)
+
+        monkeypatch.setattr(memory_log_storage, "_insert_rows", gated)
+        first = asyncio.create_task(
+            memory_log_storage.write(LogEntry(timestamp=1.0, level="INFO", message="a"))
+        )
+        joined = asyncio.create_task(
+            memory_log_storage.write(LogEntry(timestamp=2.0, level="INFO", message="b"))
+        )
+        await flushing.wait()
+
+        first.cancel()
+        release.set()
+        await joined
+
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert await memory_log_storage.count() == 2
+
+    @pytest.mark.tra("Adapter.SQLiteStorage.LevelFiltering")
+    @pytest.mark.storage
+    async def test_level_filtered_read_uses_index(
+        self, memory_log_storage: SQLiteLogStorage
+    ) -> None:
+        """Case-insensitive level reads search the UPPER(level) index."""
+        async with memory_log_storage.async_connection() as db:
+            cursor = await db.execute(
+                "EXPLAIN QUERY PLAN " + _SELECT_LOGS_BY_LEVEL, (0, "info")
+            )
+            plan = " ".join(row[3] for row in await cursor.fetchall())
+
+        assert "USING INDEX idx_logs_upper_level_timestamp" in plan
+
     @pytest.mark.tra("Adapter.SQLiteStorage.ImplementsLogStoragePort")
     @pytest.mark.storage
     async def test_memory_database_close(
@@ -214,6 +343,24 @@ class TestSQLiteLogStorage:
 
         assert deleted == 3
 
+    @pytest.mark.storage
+    async def test_delete_before_sweeps_in_batches(
+        self, log_db_path: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """delete_before commits in batches and still removes every old entry."""
+        monkeypatch.setattr(sqlite_base, "_DELETE_BATCH_SIZE", 2)
+        storage = SQLiteLogStorage(log_db_path)
+        await storage.write_many(
+            LogEntry(timestamp=1000.0 + i, level="INFO", message=f"msg {i}")
+            for i in range(7)
+        )
+
+        deleted = await storage.delete_before(1005.0)
+        remaining = [e.message async for e in storage.read()]
+
+        assert deleted == 5
+        assert remaining == ["msg 5", "msg 6"]
+
     @pytest.mark.storage
     async def test_delete_before_empty_storage(self, log_db_path: str) -> None:
         """delete_before on empty storage returns 0."""
@@ -77,3 +77,77 @@ class TestSQLiteLogStorageResilience:
         assert result[0].attributes == {"key": "value"}  # Valid entry
         assert result[1].attributes == {}  # Corrupted entry falls back to empty dict
         assert result[1].message == "corrupted"
+
+    @pytest.mark.tra("Adapter.SQLiteStorage.ImplementsLogStoragePort")
+    @pytest.mark.storage
+    def test_read_sync_round_trips_non_finite_and_large_numbers(
+        self, tmp_path: Path
+    ) -> None:
+        """Attributes json.dumps can write are read back, whichever parser runs."""
+        storage = SQLiteLogStorage(str(tmp_path / "numbers_logs.db"))
+        entry = LogEntry(
+            timestamp=1000.0,
+            level="INFO",
+            message="numbers",
+            attributes={"ratio": float("inf"), "big": 2**70},
+        )
+        storage.write_sync(entry)
+
+        result = storage.read_sync()
+
+        assert result[0].attributes == {"ratio": float("inf"), "big": 2**70}
+
+    @pytest.mark.tra("Adapter.SQLiteStorage.ImplementsLogStoragePort")
+    @pytest.mark.storage
+    def test_attributes_are_stored_as_compact_json(self, tmp_path: Path) -> None:
+        """Attributes are stored without separator spaces and read back intact."""
+        db_path = str(tmp_path / "compact_logs.db")
+        storage = SQLiteLogStorage(db_path)
+        entry = LogEntry(
+            timestamp=1000.0,
+            level="INFO",
+            message="compact",
+            attributes={"key": "value", "n": 1},
+        )
+        storage.write_sync(entry)
+
+        conn = sqlite3.connect(db_path)
+        stored = conn.execute("SELECT attributes FROM logs").fetchone()[0]
+        conn.close()
+
+        assert stored == '{"key":"value","n":1}'
+        assert storage.read_sync()[0].attributes == {"key": "value", "n": 1}
+
+    @pytest.mark.tra("Adapter.SQLiteStorage.ImplementsLogStoragePort")
+    @pytest.mark.storage
+    def test_inserts_do_not_maintain_autoincrement_sequence(
+        self, tmp_path: Path
+    ) -> None:
+        """New databases use the plain rowid, with no sqlite_sequence writes."""
+        db_path = str(tmp_path / "rowid_logs.db")
+        storage = SQLiteLogStorage(db_path)
+        storage.write_sync(LogEntry(timestamp=1000.0, level="INFO", message="x"))
+
+        conn = sqlite3.connect(db_path)
+        tables = {
+            row[0]
+            for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        }
+        conn.close()
+
+        assert "sqlite_sequence" not in tables
+
+    @pytest.mark.tra("Adapter.SQLiteStorage.ImplementsLogStoragePort")
+    @pytest.mark.storage
+    def test_empty_attributes_read_back_as_independent_dicts(
+        self, tmp_path: Path
+    ) -> None:
+        """Rows without attributes each get their own empty dict."""
+        storage = SQLiteLogStorage(str(tmp_path / "empty_attrs_logs.db"))
+        storage.write_sync(LogEntry(timestamp=1000.0, level="INFO", message="a"))
+        storage.write_sync(LogEntry(timestamp=2000.0, level="INFO", message="b"))
+
+        first, second = storage.read_sync()
+        first.attributes["mutated"] = True
+
+        assert second.attributes == {}
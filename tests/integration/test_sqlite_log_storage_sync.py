@@ -81,3 +81,23 @@ class TestSQLiteLogStorageSync:
         assert len(entries) == 2
         assert entry_sync in entries
         assert entry_async in entries
+
+    @pytest.mark.storage
+    async def test_shared_memory_sync_and_async_see_same_rows(self) -> None:
+        """shared_memory=True makes sync and async share one :memory: database."""
+        storage = SQLiteLogStorage(":memory:", shared_memory=True)
+        other = SQLiteLogStorage(":memory:", shared_memory=True)
+        sync_entry = LogEntry(timestamp=1000.0, level="INFO", message="sync")
+        async_entry = LogEntry(timestamp=1001.0, level="INFO", message="async")
+
+        try:
+            storage.write_sync(sync_entry)
+            await storage.write(async_entry)
+
+            assert [e async for e in storage.read()] == [sync_entry, async_entry]
+            assert storage.read_sync() == [sync_entry, async_entry]
+            # Each storage still gets its own database
+            assert await other.count() == 0
+        finally:
+            await storage.close()
+            await other.close()
@@ -1,8 +1,12 @@
 """Tests for SQLite metrics storage adapter."""
 
+import asyncio
+from typing import Any
+
 import pytest
 
 from observabilipy.adapters.storage import SQLiteMetricsStorage
+from observabilipy.adapters.storage.sqlite_metrics import _SELECT_METRICS_SINCE
 from observabilipy.core.models import MetricSample
 from observabilipy.core.ports import MetricsStoragePort
 
@@ -61,6 +65,19 @@ class TestSQLiteMetricsStorage:
         result = [s async for s in memory_metrics_storage.read()]
         assert len(result) == 1  # Only new entry, old DB was closed
 
+    @pytest.mark.storage
+    async def test_read_since_uses_covering_index(
+        self, memory_metrics_storage: SQLiteMetricsStorage
+    ) -> None:
+        """Timestamp range reads are served from the covering index."""
+        async with memory_metrics_storage.async_connection() as db:
+            cursor = await db.execute(
+                "EXPLAIN QUERY PLAN " + _SELECT_METRICS_SINCE, (0,)
+            )
+            plan = " ".join(row[3] for row in await cursor.fetchall())
+
+        assert "USING COVERING INDEX idx_metrics_timestamp_covering" in plan
+
     @pytest.mark.storage
     async def test_write_and_scrape_single_sample(self, metrics_db_path: str) -> None:
         """Can write a metric sample and scrape it back."""
@@ -116,6 +133,62 @@ class TestSQLiteMetricsStorage:
 
         assert result == samples
 
+    @pytest.mark.storage
+    async def test_concurrent_writes_share_one_transaction(
+        self, metrics_db_path: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Concurrent write() calls on a file database commit as one batch."""
+        storage = SQLiteMetricsStorage(metrics_db_path)
+        batches: list[int] = []
+        insert_rows = storage._insert_rows
+
+        async def spy(rows: list[tuple[Any, ...]]) -> None:
+            batches.append(len(rows))
+            await insert_rows(rows)
+
+        monkeypatch.setattr(storage, "_insert_rows", spy)
+        samples = [
+            MetricSample(name=f"metric_{i}", timestamp=1000.0 + i, value=float(i))
+            for i in range(10)
+        ]
+
+        try:
+            await asyncio.gather(*(storage.write(s) for s in samples))
+            result = [s async for s in storage.read()]
+        finally:
+            await storage.close()
+
+        assert batches == [10]
+        assert result == samples
+
+    @pytest.mark.storage
+    async def test_write_many_writes_all_samples(self, metrics_db_path: str) -> None:
+        """write_many() persists a whole batch in one transaction."""
+        storage = SQLiteMetricsStorage(metrics_db_path)
+        samples = [
+            MetricSample(
+                name=f"metric_{i}",
+                timestamp=1000.0 + i,
+                value=float(i),
+                labels={"core": str(i)},
+            )
+            for i in range(5)
+        ]
+
+        await storage.write_many(samples)
+        result = [s async for s in storage.read()]
+
+        assert result == samples
+
+    @pytest.mark.storage
+    async def test_write_many_empty_batch_is_noop(self, metrics_db_path: str) -> None:
+        """write_many() with an empty batch writes nothing."""
+        storage = SQLiteMetricsStorage(metrics_db_path)
+
+        await storage.write_many([])
+
+        assert await storage.count() == 0
+
     @pytest.mark.storage
     async def test_samples_with_different_labels_are_distinct(
         self, metrics_db_path: str
@@ -304,6 +304,26 @@ class TestWSGILogsEndpoint:
         assert "Error message" in response.text
         assert "Info message" not in response.text
 
+    @pytest.mark.tier(2)
+    @pytest.mark.tra("Adapter.WSGI.LogsEndpointLevelFilter")
+    @pytest.mark.wsgi
+    def test_logs_endpoint_decodes_percent_encoded_params(
+        self, wsgi_client_with_storage
+    ) -> None:
+        """Test that percent-encoded since/level values are decoded."""
+        client, log_storage, _metrics_storage = wsgi_client_with_storage
+        for timestamp, level in ((100.0, "ERROR"), (300.0, "ERROR"), (300.0, "INFO")):
+            _run_async(
+                log_storage.write(
+                    LogEntry(
+                        timestamp=timestamp, level=level, message=f"{level}@{timestamp}"
+                    )
+                )
+            )
+        response = client.get("/logs?since=2%30%30&level=%45rror")
+        assert response.text.count("\n") == 1
+        assert "ERROR@300.0" in response.text
+
     @pytest.mark.tier(2)
     @pytest.mark.tra("Adapter.WSGI.LogsEndpointCombinedFilters")
     @pytest.mark.wsgi
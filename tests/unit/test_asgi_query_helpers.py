@@ -8,149 +8,121 @@ from __future__ import annotations
 
 import pytest
 
-from observabilipy.adapters.frameworks.asgi import (
-    Scope,
-    _parse_level_param,
-    _parse_query_params,
-    _parse_since_param,
-)
+from observabilipy.adapters.frameworks.query_params import _parse_params
 
 
 @pytest.mark.tier(1)
 @pytest.mark.tra("Adapter.ASGI.QueryParameter.InvalidUTF8")
-def test_parse_since_param_handles_invalid_utf8_bytes():
-    """_parse_since_param should handle invalid UTF-8 bytes in query string."""
+def test_parse_params_handles_replacement_characters():
+    """_parse_params should ignore values made of UTF-8 replacement characters."""
 
-    # Arrange: Simulate invalid UTF-8 bytes in query string that would be
-    # decoded with errors='replace' to produce placeholder characters
-    query_string = "since=\ufffd\ufffd".encode()  # Replacement chars
-    params = __import__("urllib.parse", fromlist=["parse_qs"]).parse_qs(
-        query_string.decode("utf-8", errors="replace")
-    )
+    # Arrange: Replacement characters, as left by a lossy decode upstream
+    query_string = "since=\ufffd\ufffd&level=\ufffd\ufffd".encode()
 
-    # Act: Parse the 'since' parameter
-    result = _parse_since_param(params)
+    # Act: Parse the query string
+    result = _parse_params(query_string)
 
-    # Assert: Should return default value (0.0) without raising
-    assert isinstance(result, float)
-    assert result == 0.0
+    # Assert: Should return defaults without raising
+    assert result == (0.0, None)
 
 
 @pytest.mark.tier(1)
-@pytest.mark.tra("Adapter.ASGI.QueryParameter.InvalidUTF8")
-def test_parse_level_param_handles_invalid_utf8_bytes():
-    """_parse_level_param should handle invalid UTF-8 bytes in query string."""
+@pytest.mark.tra("Adapter.ASGI.QueryParameter.LevelValidation")
+@pytest.mark.parametrize("raw", [b"error", b"ERROR", b"Error"])
+def test_parse_params_returns_canonical_level(raw: bytes):
+    """_parse_params should return the shared canonical level constant."""
+    _, level = _parse_params(b"level=" + raw)
 
-    # Arrange: Simulate invalid UTF-8 bytes in query string that would be
-    # decoded with errors='replace' to produce placeholder characters
-    query_string = "level=\ufffd\ufffd".encode()  # Replacement chars
-    params = __import__("urllib.parse", fromlist=["parse_qs"]).parse_qs(
-        query_string.decode("utf-8", errors="replace")
-    )
-
-    # Act: Parse the 'level' parameter
-    result = _parse_level_param(params)
-
-    # Assert: Should return None without raising
-    assert result is None
+    assert level == "ERROR"
+    assert level is _parse_params(b"level=error")[1]
 
 
 @pytest.mark.tier(1)
 @pytest.mark.tra("Adapter.ASGI.QueryParameter.Parser")
-def test_parse_query_params_extracts_all_params():
-    """_parse_query_params should extract all parameters from scope query_string."""
-
-    # Arrange: Create scope with query string
-    scope: Scope = {
-        "type": "http",
-        "method": "GET",
-        "path": "/test",
-        "query_string": b"since=12345.0&level=INFO&other=value",
-        "headers": [],
-    }
+def test_parse_params_extracts_since_and_level():
+    """_parse_params should extract since and level and ignore other params."""
 
-    # Act: Parse query parameters
-    result = _parse_query_params(scope)
+    # Act: Parse a raw query string with an unrelated parameter
+    result = _parse_params(b"since=12345.0&level=info&other=value")
 
-    # Assert: Should return dict with all parameters
-    assert result == {"since": ["12345.0"], "level": ["INFO"], "other": ["value"]}
+    # Assert: Should return validated since and canonical level
+    assert result == (12345.0, "INFO")
 
 
 @pytest.mark.tier(1)
 @pytest.mark.tra("Adapter.ASGI.QueryParameter.Parser")
-def test_parse_query_params_handles_missing_query_string():
-    """_parse_query_params should handle scope without query_string key."""
+def test_parse_params_handles_empty_query_string():
+    """_parse_params should return defaults for an empty query string."""
 
-    # Arrange: Create scope without query_string key
-    scope: Scope = {
-        "type": "http",
-        "method": "GET",
-        "path": "/test",
-        "headers": [],
-    }
+    # Act: Parse an empty query string
+    result = _parse_params(b"")
 
-    # Act: Parse query parameters
-    result = _parse_query_params(scope)
-
-    # Assert: Should return empty dict
-    assert result == {}
+    # Assert: Should return defaults
+    assert result == (0.0, None)
 
 
 @pytest.mark.tier(1)
-@pytest.mark.tra("Adapter.ASGI.QueryParameter.SinceValidation")
-def test_since_rejects_negative_timestamp():
-    """_parse_since_param should reject negative timestamps and return 0.0."""
+@pytest.mark.tra("Adapter.ASGI.QueryParameter.Parser")
+def test_parse_params_matches_parse_qs_semantics():
+    """_parse_params should decode escapes, skip blanks, and keep first value."""
 
-    # Arrange: Create params dict with negative since value
-    params = {"since": ["-100.5"]}
+    # Act / Assert: percent-escapes are decoded
+    assert _parse_params(b"level=%45RROR") == (0.0, "ERROR")
+    # Blank values are ignored, like parse_qs
+    assert _parse_params(b"since=&since=5") == (5.0, None)
+    # First occurrence wins
+    assert _parse_params(b"level=debug&level=info") == (0.0, "DEBUG")
 
-    # Act: Parse the 'since' parameter
-    result = _parse_since_param(params)
 
-    # Assert: Should return default value (0.0)
-    assert result == 0.0
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.ASGI.QueryParameter.InvalidUTF8")
+def test_parse_params_handles_invalid_utf8_bytes():
+    """_parse_params should fall back to defaults for invalid UTF-8 bytes."""
+
+    # Act: Parse raw bytes that are not valid UTF-8
+    result = _parse_params(b"since=\xff\xfe&level=\xff")
+
+    # Assert: Should return defaults without raising
+    assert result == (0.0, None)
 
 
 @pytest.mark.tier(1)
 @pytest.mark.tra("Adapter.ASGI.QueryParameter.SinceValidation")
-def test_since_rejects_nan():
-    """_parse_since_param should reject NaN values and return 0.0."""
-
-    # Arrange: Create params dict with NaN since value
-    params = {"since": ["nan"]}
+@pytest.mark.parametrize(
+    "raw",
+    [b"-100.5", b"nan", b"inf", b"-inf", b"1" + b"0" * 400],
+    ids=["negative", "nan", "infinity", "negative-infinity", "overflow"],
+)
+def test_since_rejects_invalid_values(raw: bytes):
+    """_parse_params should return 0.0 for since values that are not valid."""
 
     # Act: Parse the 'since' parameter
-    result = _parse_since_param(params)
+    since, _ = _parse_params(b"since=" + raw)
 
-    # Assert: Should return default value (0.0)
-    assert result == 0.0
+    # Assert: Should return default value (0.0) without raising
+    assert since == 0.0
 
 
 @pytest.mark.tier(1)
 @pytest.mark.tra("Adapter.ASGI.QueryParameter.SinceValidation")
-def test_since_rejects_infinity():
-    """_parse_since_param should reject infinity values and return 0.0."""
-
-    # Arrange: Create params dict with infinity since value
-    params = {"since": ["inf"]}
+def test_since_accepts_valid_timestamp():
+    """_parse_params should accept valid positive timestamps."""
 
     # Act: Parse the 'since' parameter
-    result = _parse_since_param(params)
+    since, _ = _parse_params(b"since=1234567890.123")
 
-    # Assert: Should return default value (0.0)
-    assert result == 0.0
+    # Assert: Should return the parsed float value
+    assert since == 1234567890.123
 
 
 @pytest.mark.tier(1)
 @pytest.mark.tra("Adapter.ASGI.QueryParameter.SinceValidation")
-def test_since_accepts_valid_timestamp():
-    """_parse_since_param should accept valid positive timestamps."""
+def test_since_parses_integer_timestamp_as_float():
+    """_parse_params should return integer epochs as floats."""
 
-    # Arrange: Create params dict with valid positive since value
-    params = {"since": ["1234567890.123"]}
+    # Act: Parse an integer epoch, as scrapers send
+    since, _ = _parse_params(b"since=1700000000")
 
-    # Act: Parse the 'since' parameter
-    result = _parse_since_param(params)
-
-    # Assert: Should return the parsed float value
-    assert result == 1234567890.123
+    # Assert: Should return the same value as a float
+    assert since == 1700000000.0
+    assert isinstance(since, float)
@@ -6,9 +6,28 @@ including headers and body encoding.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
-from observabilipy.adapters.frameworks.asgi import _send_response
+from observabilipy.adapters.frameworks.asgi import (
+    _JSON_HEADERS,
+    _NDJSON_HEADERS,
+    _STREAM_CHUNK_SIZE,
+    _TEXT_HEADERS,
+    _handle_stream_endpoint,
+    _send_response,
+    _StaticResponse,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+async def _chunks(items: list[bytes]) -> AsyncIterator[bytes]:
+    """Yield pre-encoded chunks as an async iterator."""
+    for item in items:
+        yield item
 
 
 @pytest.mark.tier(1)
@@ -21,28 +40,144 @@ async def test_send_response_sends_correct_headers(asgi_send_capture):
     send, responses = asgi_send_capture
 
     # Act: Send response with specific status and content type
-    await _send_response(send, 201, "text/plain", "test body")
+    await _send_response(send, 201, _TEXT_HEADERS, b"test body")
 
     # Assert: Should send http.response.start with correct headers
     assert len(responses) == 2
     assert responses[0]["type"] == "http.response.start"
     assert responses[0]["status"] == 201
-    assert responses[0]["headers"] == [(b"content-type", b"text/plain")]
+    assert responses[0]["headers"] == [
+        (b"content-type", b"text/plain"),
+        (b"content-length", b"9"),
+    ]
 
 
 @pytest.mark.tier(1)
 @pytest.mark.tra("Adapter.ASGI.SendResponse.Body")
 @pytest.mark.asyncio
 async def test_send_response_sends_body_as_bytes(asgi_send_capture):
-    """_send_response should send http.response.body with body encoded as bytes."""
+    """_send_response should send the body bytes in http.response.body."""
 
     # Arrange: Get send capture fixture
     send, responses = asgi_send_capture
 
-    # Act: Send response with string body
-    await _send_response(send, 200, "application/json", "{'key': 'value'}")
+    # Act: Send response with a bytes body
+    await _send_response(send, 200, _JSON_HEADERS, b"{'key': 'value'}")
 
     # Assert: Should send http.response.body with encoded body
     assert len(responses) == 2
     assert responses[1]["type"] == "http.response.body"
     assert responses[1]["body"] == b"{'key': 'value'}"
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.ASGI.SendResponse.Stream")
+@pytest.mark.asyncio
+async def test_stream_endpoint_sends_small_body_in_one_frame(asgi_send_capture):
+    """Bodies smaller than the chunk size are sent as a single frame."""
+    send, responses = asgi_send_capture
+
+    await _handle_stream_endpoint(
+        send, _chunks([b"a\n", b"b\n"]), _NDJSON_HEADERS, "error"
+    )
+
+    assert [r["type"] for r in responses] == [
+        "http.response.start",
+        "http.response.body",
+    ]
+    assert responses[0]["status"] == 200
+    assert (b"content-length", b"4") in responses[0]["headers"]
+    assert responses[1]["body"] == b"a\nb\n"
+    assert not responses[1].get("more_body", False)
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.ASGI.SendResponse.Stream")
+@pytest.mark.asyncio
+async def test_stream_endpoint_flushes_large_body_in_chunks(asgi_send_capture):
+    """Bodies larger than the chunk size are streamed with more_body=True."""
+    send, responses = asgi_send_capture
+    line = b"x" * 1023 + b"\n"
+    count = (_STREAM_CHUNK_SIZE // len(line)) * 3
+
+    await _handle_stream_endpoint(
+        send, _chunks([line] * count), _NDJSON_HEADERS, "error"
+    )
+
+    bodies = responses[1:]
+    assert len(bodies) > 1
+    assert responses[0]["headers"] == list(_NDJSON_HEADERS)
+    assert all(r["more_body"] for r in bodies[:-1])
+    assert not bodies[-1].get("more_body", False)
+    assert b"".join(r["body"] for r in bodies) == line * count
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.ASGI.SendResponse.Stream")
+@pytest.mark.asyncio
+async def test_stream_endpoint_reraises_after_response_started(asgi_send_capture):
+    """Failures after the status line was sent abort instead of sending 500."""
+    send, responses = asgi_send_capture
+
+    async def failing() -> AsyncIterator[bytes]:
+        yield b"x" * _STREAM_CHUNK_SIZE
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await _handle_stream_endpoint(send, failing(), _NDJSON_HEADERS, "err")
+
+    assert responses[0]["status"] == 200
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.ASGI.SendResponse.Stream")
+@pytest.mark.asyncio
+async def test_stream_endpoint_propagates_send_errors():
+    """A send() failure is not answered with a 500 response."""
+    attempted: list[dict] = []
+
+    async def disconnected_send(message: dict) -> None:
+        attempted.append(message)
+        raise OSError("client disconnected")
+
+    with pytest.raises(OSError, match="client disconnected"):
+        await _handle_stream_endpoint(
+            disconnected_send,
+            _chunks([b"x" * _STREAM_CHUNK_SIZE] * 2),
+            _NDJSON_HEADERS,
+            "err",
+        )
+
+    assert [m["status"] for m in attempted] == [200]
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.ASGI.SendResponse.Headers")
+@pytest.mark.asyncio
+async def test_send_response_headers_are_safe_to_mutate(asgi_send_capture):
+    """Middleware editing the sent header list must not leak into later responses."""
+    send, responses = asgi_send_capture
+
+    await _send_response(send, 200, _TEXT_HEADERS, b"one")
+    responses[0]["headers"].append((b"x-added", b"1"))
+    await _send_response(send, 200, _TEXT_HEADERS, b"two")
+
+    assert (b"x-added", b"1") not in responses[2]["headers"]
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.ASGI.SendResponse.Static")
+@pytest.mark.asyncio
+async def test_static_response_matches_send_response(asgi_send_capture):
+    """_StaticResponse should send the same frames as _send_response."""
+    send, responses = asgi_send_capture
+    static = _StaticResponse(404, _TEXT_HEADERS, b"Not Found")
+
+    await static.send(send)
+    await _send_response(send, 404, _TEXT_HEADERS, b"Not Found")
+
+    assert responses[:2] == responses[2:]
+    # Each send gets its own header list
+    responses[0]["headers"].append((b"x-added", b"1"))
+    await static.send(send)
+    assert (b"x-added", b"1") not in responses[4]["headers"]
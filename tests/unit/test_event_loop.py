@@ -0,0 +1,40 @@
+"""Tests for event loop selection."""
+
+import asyncio
+import sys
+import types
+
+import pytest
+
+from observabilipy.runtime.event_loop import fast_loop_factory
+
+
+@pytest.mark.runtime
+class TestFastLoopFactory:
+    """Tests for fast_loop_factory()."""
+
+    def test_returns_asyncio_factory_when_uvloop_missing(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without uvloop the default asyncio loop factory is returned."""
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+
+        assert fast_loop_factory() is asyncio.new_event_loop
+
+    def test_returns_uvloop_factory_when_available(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """With uvloop importable its loop constructor is returned."""
+        fake_uvloop = types.ModuleType("uvloop")
+        fake_uvloop.new_event_loop = asyncio.new_event_loop  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+
+        assert fast_loop_factory() is fake_uvloop.new_event_loop  # type: ignore[attr-defined]
+
+    def test_factory_runs_a_coroutine(self) -> None:
+        """The returned factory can be passed to asyncio.run."""
+
+        async def answer() -> int:
+            return 42
+
+        assert asyncio.run(answer(), loop_factory=fast_loop_factory()) == 42
@@ -229,6 +229,20 @@ class TestInMemoryMetricsStorageSync:
 
         assert storage._samples == samples
 
+    @pytest.mark.storage
+    async def test_write_many_writes_all_samples(self) -> None:
+        """write_many() stores a whole batch in one call."""
+        storage = InMemoryMetricsStorage()
+        samples = [
+            MetricSample(name="metric_a", timestamp=1000.0, value=1.0),
+            MetricSample(name="metric_b", timestamp=1001.0, value=2.0),
+        ]
+
+        await storage.write_many(samples)
+        result = [s async for s in storage.read()]
+
+        assert result == samples
+
     @pytest.mark.storage
     def test_clear_sync_removes_all_samples(self) -> None:
         """clear_sync() removes all samples synchronously."""
@@ -145,6 +145,21 @@ class TestLogStorageWithLevelFilterPassthrough:
         result = [e async for e in storage.read()]
         assert result == [entry]
 
+    @pytest.mark.core
+    async def test_passthrough_write_many(self) -> None:
+        """write_many() delegates to underlying storage."""
+        storage = InMemoryLogStorage()
+        wrapper = LogStorageWithLevelFilter(storage)
+        entries = [
+            LogEntry(timestamp=1000.0, level="INFO", message="first"),
+            LogEntry(timestamp=1001.0, level="ERROR", message="second"),
+        ]
+
+        await wrapper.write_many(entries)
+
+        result = [e async for e in storage.read()]
+        assert result == entries
+
     @pytest.mark.core
     async def test_passthrough_read_without_level(self) -> None:
         """read() without level returns all entries."""
@@ -183,6 +183,21 @@ class TestTimedLog:
         assert exit_log.attributes["phase"] == "exit"
         assert exit_log.attributes["elapsed_seconds"] == 0.5
 
+    @pytest.mark.core
+    def test_timed_log_exit_timestamp_is_entry_plus_elapsed(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The exit timestamp is the entry timestamp plus elapsed_seconds."""
+        times = iter([100.0, 100.5])
+        monkeypatch.setattr(time, "perf_counter", lambda: next(times))
+        monkeypatch.setattr(time, "time", lambda: 1000.0)
+
+        with timed_log("task") as result:
+            pass
+
+        assert result.logs[0].timestamp == 1000.0
+        assert result.logs[1].timestamp == 1000.5
+
     @pytest.mark.core
     def test_timed_log_with_custom_level(self) -> None:
         """timed_log accepts custom log level."""
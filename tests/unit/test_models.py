@@ -46,6 +46,11 @@ class TestLogEntry:
         with pytest.raises(AttributeError):
             entry.level = "ERROR"  # type: ignore[misc]
 
+    @pytest.mark.core
+    def test_log_entry_has_no_instance_dict(self) -> None:
+        entry = LogEntry(timestamp=1702300000.0, level="INFO", message="Test")
+        assert not hasattr(entry, "__dict__")
+
 
 class TestMetricSample:
     """Tests for MetricSample model."""
@@ -82,6 +87,11 @@ class TestMetricSample:
         with pytest.raises(AttributeError):
             sample.value = 100.0  # type: ignore[misc]
 
+    @pytest.mark.core
+    def test_metric_sample_has_no_instance_dict(self) -> None:
+        sample = MetricSample(name="up", timestamp=1702300000.0, value=1.0)
+        assert not hasattr(sample, "__dict__")
+
 
 class TestRetentionPolicy:
     """Tests for RetentionPolicy model."""
@@ -7,7 +7,9 @@ import pytest
 
 from observabilipy.core.encoding.ndjson import (
     encode_logs,
+    encode_logs_iter,
     encode_ndjson,
+    encode_ndjson_iter,
     encode_ndjson_sync,
 )
 from observabilipy.core.models import LogEntry, MetricSample
@@ -177,3 +179,43 @@ class TestNdjsonMetricEncoder:
         result = encode_ndjson_sync([])
 
         assert result == ""
+
+
+class TestNdjsonStreamingEncoders:
+    """Tests for the line-at-a-time NDJSON encoders."""
+
+    @pytest.mark.encoding
+    async def test_encode_logs_iter_matches_encode_logs(self) -> None:
+        """Joined streamed lines equal the buffered encoding."""
+        entries = [
+            LogEntry(timestamp=1.0, level="INFO", message="First"),
+            LogEntry(
+                timestamp=2.0, level="ERROR", message="Second", attributes={"a": 1}
+            ),
+        ]
+
+        chunks = [c async for c in encode_logs_iter(to_async_iter(entries))]
+        expected = await encode_logs(to_async_iter(entries))
+
+        assert len(chunks) == 2
+        assert b"".join(chunks).decode() == expected
+
+    @pytest.mark.encoding
+    async def test_encode_ndjson_iter_matches_encode_ndjson(self) -> None:
+        """Joined streamed lines equal the buffered encoding."""
+        samples = [
+            MetricSample(name="cpu", timestamp=1.0, value=50.0),
+            MetricSample(name="mem", timestamp=2.0, value=10.0, labels={"h": "a"}),
+        ]
+
+        chunks = [c async for c in encode_ndjson_iter(to_async_iter(samples))]
+        expected = await encode_ndjson(to_async_iter(samples))
+
+        assert len(chunks) == 2
+        assert b"".join(chunks).decode() == expected
+
+    @pytest.mark.encoding
+    async def test_streaming_encoders_yield_nothing_when_empty(self) -> None:
+        """Empty input yields no chunks."""
+        assert [c async for c in encode_logs_iter(to_async_iter([]))] == []
+        assert [c async for c in encode_ndjson_iter(to_async_iter([]))] == []
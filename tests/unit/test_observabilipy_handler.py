@@ -1,7 +1,10 @@
 """Unit tests for ObservabilipyHandler logging adapter."""
 
 import asyncio
+import enum
+import gc
 import logging
+import sys
 import threading
 from typing import Any
 
@@ -9,6 +12,7 @@ import pytest
 
 from observabilipy.adapters.logging import ObservabilipyHandler
 from observabilipy.adapters.storage.in_memory import InMemoryLogStorage
+from observabilipy.core.models import LogEntry
 
 
 def _run_async(coro: Any) -> Any:
@@ -90,6 +94,24 @@ class TestObservabilipyHandler:
         assert entries[0].attributes["request_id"] == "abc123"
         assert entries[0].attributes["user_id"] == 42
 
+    def test_extra_attributes_keep_scalar_subclasses_only(self) -> None:
+        """Scalar subclasses such as StrEnum members pass; other values are dropped."""
+        storage = InMemoryLogStorage()
+        handler = ObservabilipyHandler(storage)
+        logger = logging.getLogger("test_extra_types")
+        logger.handlers.clear()
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+
+        class Color(enum.StrEnum):
+            RED = "red"
+
+        logger.info("typed", extra={"color": Color.RED, "items": [1, 2]})
+
+        entries = _run_async(_collect_entries(storage))
+        assert entries[0].attributes["color"] == "red"
+        assert "items" not in entries[0].attributes
+
     def test_extracts_exception_info(self) -> None:
         """Handler extracts exception info when present."""
         storage = InMemoryLogStorage()
@@ -111,6 +133,40 @@ class TestObservabilipyHandler:
         assert "exc_traceback" in entries[0].attributes
         assert "ValueError: test error" in entries[0].attributes["exc_traceback"]
 
+    def test_traceback_independent_of_other_formatters(self) -> None:
+        """Stored traceback is the same whether or not a formatter ran first."""
+
+        class CustomFormatter(logging.Formatter):
+            def formatException(self, ei: Any) -> str:
+                return "custom traceback"
+
+        try:
+            raise ValueError("test error")
+        except ValueError:
+            exc_info = sys.exc_info()
+
+        tracebacks = []
+        for formatter in (None, logging.Formatter(), CustomFormatter()):
+            storage = InMemoryLogStorage()
+            record = logging.LogRecord(
+                name="test",
+                level=logging.ERROR,
+                pathname="",
+                lineno=0,
+                msg="caught error",
+                args=(),
+                exc_info=exc_info,
+            )
+            if formatter is not None:
+                # Formatting on another handler caches record.exc_text
+                formatter.format(record)
+            ObservabilipyHandler(storage).emit(record)
+            entries = _run_async(_collect_entries(storage))
+            tracebacks.append(entries[0].attributes["exc_traceback"])
+
+        assert tracebacks[0] == tracebacks[1] == tracebacks[2]
+        assert "ValueError: test error" in tracebacks[0]
+
     def test_configurable_attributes(self) -> None:
         """Handler allows configuring which LogRecord fields to include."""
         storage = InMemoryLogStorage()
@@ -245,6 +301,64 @@ class TestAsyncAwareEmit:
         assert len(entries) == 1
         assert entries[0].message == "sync context message"
 
+    def test_emit_reuses_one_event_loop_without_running_loop(self) -> None:
+        """Sync-context emits share one private loop, closed by close()."""
+        storage = InMemoryLogStorage()
+        loops: list[asyncio.AbstractEventLoop] = []
+
+        class LoopRecordingStorage(InMemoryLogStorage):
+            async def write(self, entry: Any) -> None:
+                loops.append(asyncio.get_running_loop())
+                await storage.write(entry)
+
+        handler = ObservabilipyHandler(LoopRecordingStorage())
+        for msg in ("first", "second"):
+            record = logging.LogRecord(
+                name="test",
+                level=logging.INFO,
+                pathname="",
+                lineno=0,
+                msg=msg,
+                args=(),
+                exc_info=None,
+            )
+            handler.emit(record)
+
+        assert len(loops) == 2
+        assert loops[0] is loops[1]
+        entries = _run_async(_collect_entries(storage))
+        assert [e.message for e in entries] == ["first", "second"]
+
+        handler.close()
+        assert loops[0].is_closed()
+
+    def test_private_event_loop_closed_when_handler_collected(self) -> None:
+        """A handler that is never closed still closes its loop on collection."""
+        loops: list[asyncio.AbstractEventLoop] = []
+
+        class LoopRecordingStorage(InMemoryLogStorage):
+            async def write(self, entry: Any) -> None:
+                loops.append(asyncio.get_running_loop())
+
+        handler = ObservabilipyHandler(LoopRecordingStorage())
+        handler.emit(
+            logging.LogRecord(
+                name="test",
+                level=logging.INFO,
+                pathname="",
+                lineno=0,
+                msg="unclosed",
+                args=(),
+                exc_info=None,
+            )
+        )
+        assert not loops[0].is_closed()
+
+        del handler
+        gc.collect()
+
+        assert loops[0].is_closed()
+
     def test_emit_works_inside_running_event_loop(self) -> None:
         """emit() works when called from inside an already-running event loop."""
         storage = InMemoryLogStorage()
@@ -378,6 +492,73 @@ class TestBackgroundWriter:
         entries = _run_async(_collect_entries(storage))
         assert len(entries) == 50  # 5 threads * 10 messages
 
+    def test_background_writer_batches_queued_entries(self) -> None:
+        """Entries queued during a write are stored with one write_many()."""
+        storage = InMemoryLogStorage()
+        batches: list[list[str]] = []
+        release = threading.Event()
+
+        class GatedStorage(InMemoryLogStorage):
+            async def write_many(self, entries: Any) -> None:
+                batch = list(entries)
+                batches.append([e.message for e in batch])
+                # Hold the first write until every record has been queued
+                release.wait(timeout=2.0)
+                await storage.write_many(batch)
+
+        handler = ObservabilipyHandler(GatedStorage(), background_writer=True)
+        for i in range(10):
+            record = logging.LogRecord(
+                name="test",
+                level=logging.INFO,
+                pathname="",
+                lineno=0,
+                msg=f"message {i}",
+                args=(),
+                exc_info=None,
+            )
+            handler.emit(record)
+        release.set()
+        handler.close()
+
+        assert len(batches) <= 2
+        assert [m for batch in batches for m in batch] == [
+            f"message {i}" for i in range(10)
+        ]
+        entries = _run_async(_collect_entries(storage))
+        assert len(entries) == 10
+
+    def test_background_writer_supports_storage_without_write_many(self) -> None:
+        """Storages that only implement write() still get every record."""
+        messages: list[str] = []
+        writer_threads: set[threading.Thread] = set()
+
+        class WriteOnlyStorage:
+            async def write(self, entry: LogEntry) -> None:
+                writer_threads.add(threading.current_thread())
+                messages.append(entry.message)
+
+        handler = ObservabilipyHandler(
+            WriteOnlyStorage(),  # type: ignore[arg-type]
+            background_writer=True,
+        )
+        for i in range(3):
+            handler.emit(
+                logging.LogRecord(
+                    name="test",
+                    level=logging.INFO,
+                    pathname="",
+                    lineno=0,
+                    msg=f"message {i}",
+                    args=(),
+                    exc_info=None,
+                )
+            )
+        handler.close()
+
+        assert messages == ["message 0", "message 1", "message 2"]
+        assert writer_threads == {handler._writer_thread}
+
     def test_background_writer_default_is_false(self) -> None:
         """background_writer defaults to False (sync behavior)."""
         storage = InMemoryLogStorage()
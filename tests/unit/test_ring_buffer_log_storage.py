@@ -46,6 +46,20 @@ class TestRingBufferLogStorage:
 
         assert result == [entry]
 
+    @pytest.mark.storage
+    async def test_write_many_respects_max_size(self) -> None:
+        """write_many() appends a batch and still evicts beyond max_size."""
+        storage = RingBufferLogStorage(max_size=3)
+        entries = [
+            LogEntry(timestamp=float(i), level="INFO", message=f"msg{i}")
+            for i in range(5)
+        ]
+
+        await storage.write_many(entries)
+        result = [e async for e in storage.read()]
+
+        assert result == entries[2:]
+
     @pytest.mark.storage
     async def test_read_returns_empty_when_no_entries(self) -> None:
         """Read returns empty iterable when storage is empty."""
@@ -329,6 +343,32 @@ class TestRingBufferLogStorage:
 
         assert result == [new_error]
 
+    @pytest.mark.storage
+    async def test_read_latest_returns_newest_first(self) -> None:
+        """read_latest() returns the most recently written entries, newest first."""
+        storage = RingBufferLogStorage(max_size=100)
+        entries = [
+            LogEntry(timestamp=float(i), level="INFO", message=f"m{i}")
+            for i in range(5)
+        ]
+        for entry in entries:
+            await storage.write(entry)
+
+        assert await storage.read_latest(3) == entries[:1:-1]
+        assert await storage.read_latest(10) == entries[::-1]
+        assert await storage.read_latest(0) == []
+
+    @pytest.mark.storage
+    async def test_read_latest_follows_write_order_not_timestamp(self) -> None:
+        """read_latest() orders by write order even if timestamps disagree."""
+        storage = RingBufferLogStorage(max_size=100)
+        newer = LogEntry(timestamp=2000.0, level="INFO", message="newer")
+        late = LogEntry(timestamp=1000.0, level="INFO", message="written late")
+        await storage.write(newer)
+        await storage.write(late)
+
+        assert await storage.read_latest(1) == [late]
+
     @pytest.mark.storage
     async def test_read_level_returns_empty_for_nonexistent_level(self) -> None:
         """Read with non-existent level returns empty result."""
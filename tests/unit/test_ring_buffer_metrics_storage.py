@@ -111,6 +111,20 @@ class TestRingBufferMetricsStorage:
         # Only last 3 should remain
         assert result == samples[2:]
 
+    @pytest.mark.storage
+    async def test_write_many_respects_max_size(self) -> None:
+        """write_many() appends a batch and still evicts beyond max_size."""
+        storage = RingBufferMetricsStorage(max_size=3)
+        samples = [
+            MetricSample(name=f"m_{i}", timestamp=float(i), value=float(i))
+            for i in range(5)
+        ]
+
+        await storage.write_many(samples)
+        result = [s async for s in storage.read()]
+
+        assert result == samples[2:]
+
     @pytest.mark.storage
     async def test_count_returns_zero_when_empty(self) -> None:
         """Count returns 0 for empty storage."""
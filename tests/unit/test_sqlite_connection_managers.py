@@ -5,11 +5,21 @@ properly initialize the schema and maintain independent connections
 for :memory: databases.
 """
 
+import asyncio
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import aiosqlite
 import pytest
 
 from observabilipy.adapters.storage.sqlite_base import (
+    _FORK_ORPHANS,
+    _ITER_CHUNK_SIZE,
     AsyncConnectionManager,
     SyncConnectionManager,
+    _abandon_pools_after_fork,
 )
 
 pytestmark = [
@@ -47,6 +57,94 @@ class TestAsyncConnectionManager:
         finally:
             await manager.close()
 
+    @pytest.mark.storage
+    def test_async_init_runs_once_across_threads(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Threads running separate loops share one :memory: connection."""
+        manager = AsyncConnectionManager(":memory:", TEST_SCHEMA)
+        connect = aiosqlite.connect
+        connect_calls: list[str] = []
+
+        def slow_connect(*args: Any, **kwargs: Any) -> aiosqlite.Connection:
+            connect_calls.append(args[0])
+            time.sleep(0.05)  # Hold the init open so the other thread races it
+            return connect(*args, **kwargs)
+
+        monkeypatch.setattr(aiosqlite, "connect", slow_connect)
+        threads = [
+            threading.Thread(target=asyncio.run, args=(manager._ensure_initialized(),))
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert connect_calls == [":memory:"]
+        asyncio.run(manager.close())
+
+    @pytest.mark.storage
+    async def test_async_file_connection_applies_pragmas(self, tmp_path: Path) -> None:
+        """File database connections use WAL-friendly per-connection settings."""
+        manager = AsyncConnectionManager(str(tmp_path / "test.db"), TEST_SCHEMA)
+
+        async with manager.connection() as conn:
+            cursor = await conn.execute("PRAGMA synchronous")
+            synchronous = await cursor.fetchone()
+            cursor = await conn.execute("PRAGMA temp_store")
+            temp_store = await cursor.fetchone()
+            cursor = await conn.execute("PRAGMA cache_size")
+            cache_size = await cursor.fetchone()
+
+        # 1 = NORMAL, 2 = MEMORY; negative cache sizes are in KiB
+        assert synchronous[0] == 1
+        assert temp_store[0] == 2
+        assert cache_size[0] == -20000
+
+    @pytest.mark.storage
+    @pytest.mark.parametrize("db_name", [":memory:", "test.db"])
+    async def test_async_cursors_fetch_rows_in_large_chunks(
+        self, tmp_path: Path, db_name: str
+    ) -> None:
+        """Cursor iteration fetches many rows per trip to the connection thread."""
+        db_path = db_name if db_name == ":memory:" else str(tmp_path / db_name)
+        manager = AsyncConnectionManager(db_path, TEST_SCHEMA)
+
+        try:
+            async with manager.connection() as conn:
+                async with conn.execute("SELECT 1") as cursor:
+                    assert cursor.iter_chunk_size == _ITER_CHUNK_SIZE
+        finally:
+            await manager.close()
+
+    @pytest.mark.storage
+    async def test_async_file_connections_are_reused(self, tmp_path: Path) -> None:
+        """A released file connection is handed out again; close() drops it."""
+        manager = AsyncConnectionManager(str(tmp_path / "test.db"), TEST_SCHEMA)
+
+        async with manager.connection() as first:
+            pass
+        async with manager.connection() as second:
+            pass
+
+        assert second is first
+        await manager.close()
+        assert manager._idle == []
+
+    @pytest.mark.storage
+    async def test_async_connection_is_not_reused_after_error(
+        self, tmp_path: Path
+    ) -> None:
+        """A connection whose block raised is closed instead of pooled."""
+        manager = AsyncConnectionManager(str(tmp_path / "test.db"), TEST_SCHEMA)
+
+        with pytest.raises(ValueError, match="boom"):
+            async with manager.connection():
+                raise ValueError("boom")
+
+        assert manager._idle == []
+
 
 class TestSyncConnectionManager:
     """Tests for SyncConnectionManager."""
@@ -64,6 +162,72 @@ class TestSyncConnectionManager:
             row = cursor.fetchone()
             assert row[0] == 1
 
+    @pytest.mark.storage
+    def test_sync_file_connection_applies_pragmas(self, tmp_path: Path) -> None:
+        """File database connections use WAL-friendly per-connection settings."""
+        manager = SyncConnectionManager(str(tmp_path / "test.db"), TEST_SCHEMA)
+
+        with manager.connection() as conn:
+            synchronous = conn.execute("PRAGMA synchronous").fetchone()
+            temp_store = conn.execute("PRAGMA temp_store").fetchone()
+            cache_size = conn.execute("PRAGMA cache_size").fetchone()
+
+        # 1 = NORMAL, 2 = MEMORY; negative cache sizes are in KiB
+        assert synchronous[0] == 1
+        assert temp_store[0] == 2
+        assert cache_size[0] == -20000
+
+    @pytest.mark.storage
+    def test_sync_file_connections_are_reused_across_threads(
+        self, tmp_path: Path
+    ) -> None:
+        """A pooled connection can be used by a thread other than its opener."""
+        manager = SyncConnectionManager(str(tmp_path / "test.db"), TEST_SCHEMA)
+        with manager.connection() as first:
+            pass
+
+        def use_pooled() -> None:
+            with manager.connection() as conn:
+                assert conn is first
+                conn.execute("INSERT INTO test_items (name) VALUES (?)", ("x",))
+                conn.commit()
+
+        thread = threading.Thread(target=use_pooled)
+        thread.start()
+        thread.join()
+
+        with manager.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM test_items").fetchone()[0] == 1
+        manager.close()
+        assert manager._idle == []
+
+
+class TestConnectionPoolsAcrossFork:
+    """Tests that idle pools are not reused in a forked child process."""
+
+    @pytest.mark.storage
+    async def test_pools_are_abandoned_without_closing(self, tmp_path: Path) -> None:
+        """After fork, pools are emptied and inherited connections left open."""
+        async_manager = AsyncConnectionManager(str(tmp_path / "a.db"), TEST_SCHEMA)
+        sync_manager = SyncConnectionManager(str(tmp_path / "s.db"), TEST_SCHEMA)
+        async with async_manager.connection() as async_db:
+            pass
+        with sync_manager.connection() as sync_conn:
+            pass
+
+        _abandon_pools_after_fork()
+        try:
+            assert async_manager._idle == []
+            assert sync_manager._idle == []
+            # Still open: closing inherited connections could disturb the parent
+            sync_conn.execute("SELECT 1")
+            await async_db.execute("SELECT 1")
+        finally:
+            _FORK_ORPHANS.remove(async_db)
+            _FORK_ORPHANS.remove(sync_conn)
+            await async_db.close()
+            sync_conn.close()
+
 
 class TestConnectionManagerIndependence:
     """Tests verifying sync and async managers are independent for :memory: DBs."""